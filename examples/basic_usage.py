@@ -4,6 +4,8 @@
 連続閉眼検知アルゴリズムの基本的な使用方法を示します。
 """
 
+import numpy as np
+
 from drowsy_detection.config.config import Config
 from drowsy_detection.config.validators import InputData
 from drowsy_detection.core.drowsy_detector import DrowsyDetector
@@ -27,47 +29,42 @@ def basic_example():
     # 検出器初期化
     detector = DrowsyDetector(config)
     
-    # シミュレーションデータ
-    simulation_data = [
+    # シミュレーションデータ（区間ごとの値とフレーム数）
+    segments = [
         # 正常な開眼状態
-        *[{"frame_num": i, "left_eye_open": 0.8, "right_eye_open": 0.9, "face_confidence": 0.95} 
-          for i in range(1, 11)],
-        
+        (0.8, 0.9, 0.95, 10),
         # 軽い閉眼（短時間）
-        *[{"frame_num": i, "left_eye_open": 0.25, "right_eye_open": 0.20, "face_confidence": 0.90} 
-          for i in range(11, 21)],
-        
+        (0.25, 0.20, 0.90, 10),
         # 開眼に戻る
-        *[{"frame_num": i, "left_eye_open": 0.7, "right_eye_open": 0.8, "face_confidence": 0.95} 
-          for i in range(21, 31)],
-        
+        (0.7, 0.8, 0.95, 10),
         # 長時間閉眼（眠気検知対象）
-        *[{"frame_num": i, "left_eye_open": 0.15, "right_eye_open": 0.18, "face_confidence": 0.92} 
-          for i in range(31, 71)],  # 40フレーム = 約1.3秒（30fps想定）
-        
+        (0.15, 0.18, 0.92, 40),  # 40フレーム = 約1.3秒（30fps想定）
         # 再び開眼
-        *[{"frame_num": i, "left_eye_open": 0.8, "right_eye_open": 0.85, "face_confidence": 0.95} 
-          for i in range(71, 81)],
+        (0.8, 0.85, 0.95, 10),
     ]
+    left_eye, right_eye, face_conf, counts = (np.array(column) for column in zip(*segments))
+    left_eye = np.repeat(left_eye, counts)
+    right_eye = np.repeat(right_eye, counts)
+    face_conf = np.repeat(face_conf, counts)
+    frame_nums = np.arange(1, len(left_eye) + 1)
     
     print("シミュレーション開始...")
     
-    # 処理実行
-    drowsy_detected = False
-    for data in simulation_data:
-        input_data = InputData(**data)
-        result = detector.update(input_data)
-        
-        # 重要なイベントのみ表示
-        if result.is_drowsy == 1 and not drowsy_detected:
-            print(f"⚠️  眠気検知！ フレーム {result.frame_num}")
-            print(f"   連続閉眼時間: {result.continuous_time:.2f}秒")
-            drowsy_detected = True
-        elif result.is_drowsy == 0 and drowsy_detected:
-            print(f"✅ 覚醒状態に戻りました フレーム {result.frame_num}")
-            drowsy_detected = False
-        elif result.is_drowsy == -1:
-            print(f"❌ エラー発生 フレーム {result.frame_num}: {result.error_code}")
+    # 処理実行（全フレームを一度に処理）
+    results = detector.update_batch(frame_nums, left_eye, right_eye, face_conf)
+    
+    # 重要なイベントのみ表示（眠気判定の立ち上がり・立ち下がりとエラー）
+    drowsy = (results.is_drowsy == 1).astype(np.int8)
+    transitions = np.diff(drowsy, prepend=0)
+    events = np.flatnonzero((transitions != 0) | (results.is_drowsy == -1))
+    for i in events.tolist():
+        if results.is_drowsy[i] == -1:
+            print(f"❌ エラー発生 フレーム {results.frame_num[i]}: {results.error_code[i]}")
+        elif transitions[i] == 1:
+            print(f"⚠️  眠気検知！ フレーム {results.frame_num[i]}")
+            print(f"   連続閉眼時間: {results.continuous_time[i]:.2f}秒")
+        else:
+            print(f"✅ 覚醒状態に戻りました フレーム {results.frame_num[i]}")
     
     print("\nシミュレーション完了")
     
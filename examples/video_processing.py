@@ -4,18 +4,25 @@
 実際の動画ストリームを想定した連続閉眼検知の使用例を示します。
 """
 
+import random
+import time
+
+import numpy as np
+
 from drowsy_detection.config.config import Config
 from drowsy_detection.config.validators import InputData
 from drowsy_detection.core.drowsy_detector import DrowsyDetector
 
 
-def simulate_video_stream(duration_seconds: int = 30, fps: int = 30):
+def simulate_video_stream(duration_seconds: int = 30, fps: int = 30, realtime: bool = False):
     """
     動画ストリームをシミュレート
     
     Args:
         duration_seconds: シミュレーション時間（秒）
         fps: フレームレート
+        realtime: True の場合、フレームごとに待機して実時間の進行を模擬
+            （表示される平均FPSは False の場合のみ処理性能を表します）
     """
     print(f"=== 動画ストリームシミュレーション ({duration_seconds}秒, {fps}fps) ===\n")
     
@@ -41,22 +48,16 @@ def simulate_video_stream(duration_seconds: int = 30, fps: int = 30):
     print(f"総フレーム数: {total_frames}")
     print("処理開始...\n")
     
-    start_time = time.time()
+    # シナリオベースの開眼度をまとめて生成
+    left_eyes, right_eyes, face_confs = generate_realistic_stream(total_frames)
     
-    for frame_num in range(1, total_frames + 1):
-        # シナリオベースの開眼度生成
-        left_eye, right_eye, face_conf = generate_realistic_data(frame_num, total_frames)
-        
-        # 入力データ作成
-        input_data = InputData(
-            frame_num=frame_num,
-            left_eye_open=left_eye,
-            right_eye_open=right_eye,
-            face_confidence=face_conf
-        )
-        
-        # 処理実行
-        result = detector.update(input_data)
+    start_time = time.perf_counter()
+    
+    for frame_num, left_eye, right_eye, face_conf in zip(
+        range(1, total_frames + 1), left_eyes.tolist(), right_eyes.tolist(), face_confs.tolist()
+    ):
+        # 処理実行（生成済みの値は範囲内のため InputData の検証を省略）
+        result = detector.update_raw(frame_num, left_eye, right_eye, face_conf)
         
         # 眠気検知の追跡
         if result.is_drowsy == 1 and current_drowsy_start is None:
@@ -76,14 +77,15 @@ def simulate_video_stream(duration_seconds: int = 30, fps: int = 30):
             print(f"進捗: {elapsed:.0f}/{duration_seconds}秒 ({elapsed/duration_seconds*100:.0f}%)")
         
         # リアルタイム処理をシミュレート
-        time.sleep(1.0 / fps / 10)  # 実際の1/10速度で実行
+        if realtime:
+            time.sleep(1.0 / fps / 10)  # 実際の1/10速度で実行
     
     # 最後の眠気期間を処理
     if current_drowsy_start is not None:
         drowsy_duration = (total_frames - current_drowsy_start) / fps
         drowsy_periods.append((current_drowsy_start, total_frames, drowsy_duration))
     
-    processing_time = time.time() - start_time
+    processing_time = time.perf_counter() - start_time
     
     # 結果報告
     print(f"\n=== 処理完了 ===")
@@ -110,33 +112,29 @@ def simulate_video_stream(duration_seconds: int = 30, fps: int = 30):
     print(f"最終フィルタ値 (右目): {stats['right_eye_filter']['filtered_value']:.3f}")
 
 
-def generate_realistic_data(frame_num: int, total_frames: int):
+def generate_realistic_stream(total_frames: int):
     """
-    リアルな開眼度データを生成
+    リアルな開眼度データを全フレーム分まとめて生成
     
     Args:
-        frame_num: 現在のフレーム番号
         total_frames: 総フレーム数
         
     Returns:
-        (left_eye_open, right_eye_open, face_confidence)
+        (left_eye_open, right_eye_open, face_confidence) の配列
     """
-    progress = frame_num / total_frames
-    
-    # 基本的な開眼状態
-    base_left = 0.8
-    base_right = 0.85
+    rng = np.random.default_rng()
+    progress = np.arange(1, total_frames + 1) / total_frames
     
-    # 時間による疲労の増加
-    fatigue_factor = progress * 0.3  # 30%まで疲労
-    base_left -= fatigue_factor
-    base_right -= fatigue_factor
+    # 基本的な開眼状態（時間による疲労で30%まで低下）
+    fatigue_factor = progress * 0.3
+    base_left = 0.8 - fatigue_factor
+    base_right = 0.85 - fatigue_factor
     
-    # まばたき（ランダム）
-    if random.random() < 0.05:  # 5%の確率でまばたき
-        blink_intensity = random.uniform(0.3, 0.8)
-        base_left *= (1 - blink_intensity)
-        base_right *= (1 - blink_intensity)
+    # まばたき（5%の確率）
+    blink = rng.random(total_frames) < 0.05
+    blink_scale = np.where(blink, 1 - rng.uniform(0.3, 0.8, total_frames), 1.0)
+    base_left *= blink_scale
+    base_right *= blink_scale
     
     # 眠気エピソード（特定の時間帯）
     drowsy_episodes = [
@@ -145,32 +143,37 @@ def generate_realistic_data(frame_num: int, total_frames: int):
     ]
     
     for start, end in drowsy_episodes:
-        if start <= progress <= end:
-            # 眠気期間中は開眼度が低下
-            drowsy_intensity = 0.7 * (1 - abs(progress - (start + end) / 2) / ((end - start) / 2))
-            base_left *= (1 - drowsy_intensity)
-            base_right *= (1 - drowsy_intensity)
+        # 眠気期間中は開眼度が低下
+        in_episode = (start <= progress) & (progress <= end)
+        drowsy_intensity = 0.7 * (1 - np.abs(progress - (start + end) / 2) / ((end - start) / 2))
+        episode_scale = np.where(in_episode, 1 - drowsy_intensity, 1.0)
+        base_left *= episode_scale
+        base_right *= episode_scale
     
     # ノイズ追加
     noise_level = 0.1
-    left_eye = base_left + random.uniform(-noise_level, noise_level)
-    right_eye = base_right + random.uniform(-noise_level, noise_level)
+    left_eye = base_left + rng.uniform(-noise_level, noise_level, total_frames)
+    right_eye = base_right + rng.uniform(-noise_level, noise_level, total_frames)
     
-    # 顔検出信頼度（時々低下）
-    face_confidence = 0.9
-    if random.random() < 0.02:  # 2%の確率で信頼度低下
-        face_confidence = random.uniform(0.4, 0.7)
+    # 顔検出信頼度（2%の確率で低下）
+    low_conf = rng.random(total_frames) < 0.02
+    face_confidence = np.where(low_conf, rng.uniform(0.4, 0.7, total_frames), 0.9)
     
     # 値の範囲制限
-    left_eye = max(0.0, min(1.0, left_eye))
-    right_eye = max(0.0, min(1.0, right_eye))
-    face_confidence = max(0.0, min(1.0, face_confidence))
-    
-    return left_eye, right_eye, face_confidence
+    return (
+        np.clip(left_eye, 0.0, 1.0),
+        np.clip(right_eye, 0.0, 1.0),
+        np.clip(face_confidence, 0.0, 1.0)
+    )
 
 
-def real_time_monitoring_example():
-    """リアルタイム監視の例"""
+def real_time_monitoring_example(realtime: bool = False):
+    """
+    リアルタイム監視の例
+    
+    Args:
+        realtime: True の場合、フレームごとに待機して実時間の進行を模擬
+    """
     print("\n=== リアルタイム監視例 ===\n")
     
     config = Config(
@@ -209,7 +212,8 @@ def real_time_monitoring_example():
                 print(f"🚨 ALERT: 眠気検知！ 時刻: {i/30:.1f}秒")
         
         # リアルタイム処理間隔
-        time.sleep(0.01)  # 実際より高速
+        if realtime:
+            time.sleep(0.01)  # 実際より高速
     
     print(f"監視完了。アラート発生回数: {alert_count}")
 
@@ -8,7 +8,21 @@ Windows CMD環境でのUnicode対応
 import base64
 import os
 import sys
-from datetime import datetime
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import NamedTuple
+
+
+class CommitEnv(NamedTuple):
+    """GitHub Actions から環境変数で渡されるコミット情報（デコード済み）"""
+    commit_hash: str
+    commit_short: str
+    commit_message: str
+    commit_date: str
+    branch_name: str
+    version: str
+    changelog: str
 
 
 def safe_print(text: str):
@@ -21,109 +35,115 @@ def safe_print(text: str):
         print(safe_text)
 
 
+_b64decode = base64.b64decode
+
+
+def _decode_b64_text(encoded: str) -> str:
+    """Base64エンコードされた UTF-8 文字列をデコード（失敗時は元の文字列を返す）"""
+    if not encoded:
+        return ""  # 未設定時はデコード不要
+    if not encoded.isascii():
+        return encoded  # Base64 として不正な文字を含む
+    try:
+        return _b64decode(encoded).decode('utf-8')
+    except ValueError:  # binascii.Error / UnicodeDecodeError
+        return encoded
+
+
 def decode_commit_message(encoded_message: str) -> str:
     """Base64エンコードされたコミットメッセージをデコード"""
-    try:
-        return base64.b64decode(encoded_message).decode('utf-8')
-    except Exception:
-        return encoded_message  # デコードに失敗した場合は元の文字列を返す
+    return _decode_b64_text(encoded_message)
 
 
 def decode_changelog(encoded_changelog: str) -> str:
     """Base64エンコードされたchangelogをデコード"""
-    try:
-        return base64.b64decode(encoded_changelog).decode('utf-8')
-    except Exception:
-        return encoded_changelog  # デコードに失敗した場合は元の文字列を返す
+    return _decode_b64_text(encoded_changelog)
+
+
+@lru_cache(maxsize=1)
+def _env() -> CommitEnv:
+    """GitHub Actionsの出力から情報を取得（環境変数の読み込みとデコードは初回のみ）"""
+    environ = os.environ
+    return CommitEnv(
+        commit_hash=environ.get('COMMIT_HASH', 'unknown'),
+        commit_short=environ.get('COMMIT_SHORT', 'unknown'),
+        commit_message=decode_commit_message(environ.get('COMMIT_MESSAGE_B64', '')),
+        commit_date=environ.get('COMMIT_DATE', 'unknown'),
+        branch_name=environ.get('BRANCH_NAME', 'unknown'),
+        version=environ.get('VERSION', 'unknown'),
+        changelog=decode_changelog(environ.get('CHANGELOG_B64', ''))
+    )
 
 
 def display_info():
     """情報を表示"""
-    # GitHub Actionsの出力から情報を取得
-    commit_hash = os.environ.get('COMMIT_HASH', 'unknown')
-    commit_short = os.environ.get('COMMIT_SHORT', 'unknown')
-    commit_message_b64 = os.environ.get('COMMIT_MESSAGE_B64', '')
-    commit_date = os.environ.get('COMMIT_DATE', 'unknown')
-    branch_name = os.environ.get('BRANCH_NAME', 'unknown')
-    version = os.environ.get('VERSION', 'unknown')
-    changelog_b64 = os.environ.get('CHANGELOG_B64', '')
-    
-    # コミットメッセージとchangelogをデコード
-    commit_message = decode_commit_message(commit_message_b64)
-    changelog = decode_changelog(changelog_b64)
+    commit_hash, commit_short, commit_message, commit_date, branch_name, version, changelog = _env()
     
     # 現在時刻を取得
-    current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S JST')
+    current_time = time.strftime('%Y-%m-%d %H:%M:%S JST')
     
-    safe_print("==========================================")
-    safe_print("[INFO] プロジェクト情報")
-    safe_print("==========================================")
-    safe_print(f"[VER] バージョン: {version}")
-    safe_print(f"[BR] ブランチ: {branch_name}")
-    safe_print(f"[TIME] 実行日時: {current_time}")
-    safe_print("")
-    safe_print("==========================================")
-    safe_print("[COMMIT] コミット情報")
-    safe_print("==========================================")
-    safe_print(f"[HASH] コミットハッシュ: {commit_hash}")
-    safe_print(f"[SHORT] 短縮ハッシュ: {commit_short}")
-    safe_print(f"[MSG] コミットメッセージ: {commit_message}")
-    safe_print(f"[DATE] コミット日時: {commit_date}")
-    safe_print("")
-    safe_print("==========================================")
-    safe_print("[CHANGELOG] 変更ログ（直近5コミット）")
-    safe_print("==========================================")
-    safe_print(changelog)
-    safe_print("")
-    safe_print("==========================================")
-    safe_print("[OK] 情報表示完了")
-    safe_print("==========================================")
+    rule = "==========================================\n"
+    safe_print(
+        f"{rule}"
+        "[INFO] プロジェクト情報\n"
+        f"{rule}"
+        f"[VER] バージョン: {version}\n"
+        f"[BR] ブランチ: {branch_name}\n"
+        f"[TIME] 実行日時: {current_time}\n"
+        "\n"
+        f"{rule}"
+        "[COMMIT] コミット情報\n"
+        f"{rule}"
+        f"[HASH] コミットハッシュ: {commit_hash}\n"
+        f"[SHORT] 短縮ハッシュ: {commit_short}\n"
+        f"[MSG] コミットメッセージ: {commit_message}\n"
+        f"[DATE] コミット日時: {commit_date}\n"
+        "\n"
+        f"{rule}"
+        "[CHANGELOG] 変更ログ（直近5コミット）\n"
+        f"{rule}"
+        f"{changelog}\n"
+        "\n"
+        f"{rule}"
+        "[OK] 情報表示完了\n"
+        f"{rule.rstrip()}"
+    )
 
 
 def save_to_file():
     """情報をファイルに保存"""
-    # GitHub Actionsの出力から情報を取得
-    commit_hash = os.environ.get('COMMIT_HASH', 'unknown')
-    commit_short = os.environ.get('COMMIT_SHORT', 'unknown')
-    commit_message_b64 = os.environ.get('COMMIT_MESSAGE_B64', '')
-    commit_date = os.environ.get('COMMIT_DATE', 'unknown')
-    branch_name = os.environ.get('BRANCH_NAME', 'unknown')
-    version = os.environ.get('VERSION', 'unknown')
-    changelog_b64 = os.environ.get('CHANGELOG_B64', '')
-    
-    # コミットメッセージとchangelogをデコード
-    commit_message = decode_commit_message(commit_message_b64)
-    changelog = decode_changelog(changelog_b64)
+    commit_hash, commit_short, commit_message, commit_date, branch_name, version, changelog = _env()
     
     # 現在時刻を取得
-    current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S JST')
+    current_time = time.strftime('%Y-%m-%d %H:%M:%S JST')
+    
+    body = (
+        "プロジェクト情報\n"
+        "================\n"
+        f"バージョン: {version}\n"
+        f"ブランチ: {branch_name}\n"
+        f"実行日時: {current_time}\n"
+        "\n"
+        "コミット情報\n"
+        "============\n"
+        f"コミットハッシュ: {commit_hash}\n"
+        f"短縮ハッシュ: {commit_short}\n"
+        f"コミットメッセージ: {commit_message}\n"
+        f"コミット日時: {commit_date}\n"
+        "\n"
+        "変更ログ（直近5コミット）\n"
+        "========================\n"
+        f"{changelog}\n"
+    )
     
-    # ファイルに保存（UTF-8エンコーディング）
+    # ファイルに保存（UTF-8エンコーディング、1回の書き込み）
     try:
-        with open('commit_info.txt', 'w', encoding='utf-8') as f:
-            f.write("プロジェクト情報\n")
-            f.write("================\n")
-            f.write(f"バージョン: {version}\n")
-            f.write(f"ブランチ: {branch_name}\n")
-            f.write(f"実行日時: {current_time}\n")
-            f.write("\n")
-            f.write("コミット情報\n")
-            f.write("============\n")
-            f.write(f"コミットハッシュ: {commit_hash}\n")
-            f.write(f"短縮ハッシュ: {commit_short}\n")
-            f.write(f"コミットメッセージ: {commit_message}\n")
-            f.write(f"コミット日時: {commit_date}\n")
-            f.write("\n")
-            f.write("変更ログ（直近5コミット）\n")
-            f.write("========================\n")
-            f.write(f"{changelog}\n")
+        Path('commit_info.txt').write_text(body, encoding='utf-8')
         
         safe_print("[SAVE] 情報を commit_info.txt に保存しました")
         
-        # ファイル内容を表示
-        with open('commit_info.txt', 'r', encoding='utf-8') as f:
-            content = f.read()
-            safe_print(content)
+        # ファイル内容を表示（書き込んだ内容をそのまま使用）
+        safe_print(body)
             
     except Exception as e:
         safe_print(f"[ERROR] ファイル保存エラー: {e}")
@@ -131,7 +151,9 @@ def save_to_file():
 
 def main():
     """メイン処理"""
-    import sys
+    # 出力できない文字は置換して表示（以降の出力ごとの例外処理を不要にする）
+    if hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(errors='replace')
     
     if len(sys.argv) > 1 and sys.argv[1] == 'save':
         save_to_file()
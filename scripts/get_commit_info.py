@@ -7,7 +7,9 @@ GitHub Actions用コミット情報取得スクリプト
 import subprocess
 import tomllib
 import base64
+import importlib.metadata
 import json
+import os
 import sys
 from pathlib import Path
 
@@ -28,30 +30,47 @@ def run_git_command(command: str) -> str:
         return ""
 
 
+def get_project_version() -> str:
+    """
+    プロジェクトのバージョンを取得
+    
+    pyproject.toml を1回だけ読み込み、[project] テーブルの version を返します。
+    ファイルが見つからない場合はインストール済みパッケージのメタデータを参照します。
+    """
+    try:
+        with open('pyproject.toml', 'rb') as f:
+            data = tomllib.load(f)
+    except FileNotFoundError:
+        return importlib.metadata.version('drowsy_detection')
+    return data['project']['version']
+
+
 def get_commit_info():
     """コミット情報を取得"""
     info = {}
     
-    # コミットハッシュ
-    info['commit_hash'] = run_git_command('git rev-parse HEAD')
-    info['commit_short'] = run_git_command('git rev-parse --short HEAD')
+    # コミットハッシュ・短縮ハッシュ・メッセージ・日時を1回の git 呼び出しで取得
+    # （区切りにはメッセージに現れない単位区切り文字 \x1f を使用）
+    fields = run_git_command('git log -1 --pretty=format:%H%x1f%h%x1f%s%x1f%ci').split('\x1f')
+    if len(fields) != 4:
+        fields = [''] * 4
+    commit_hash, commit_short, commit_message, commit_date = fields
+    info['commit_hash'] = commit_hash
+    info['commit_short'] = commit_short
     
     # コミットメッセージ
-    commit_message = run_git_command('git log -1 --pretty=format:"%s"')
     info['commit_message'] = commit_message
     info['commit_message_b64'] = base64.b64encode(commit_message.encode('utf-8')).decode('ascii')
     
     # コミット日時
-    info['commit_date'] = run_git_command('git log -1 --pretty=format:"%ci"')
+    info['commit_date'] = commit_date
     
     # ブランチ名
     info['branch_name'] = run_git_command('git rev-parse --abbrev-ref HEAD')
     
     # バージョン情報（pyproject.tomlから）
     try:
-        with open('pyproject.toml', 'rb') as f:
-            data = tomllib.load(f)
-            info['version'] = data['project']['version']
+        info['version'] = get_project_version()
     except Exception as e:
         print(f"バージョン取得エラー: {e}", file=sys.stderr)
         info['version'] = "unknown"
@@ -70,15 +89,14 @@ def write_github_output(info: dict):
     
     if github_output_path:
         try:
+            # 安全な出力のみ（Base64エンコードされたもの）
+            safe_outputs = [
+                'commit_hash', 'commit_short', 'commit_message_b64', 
+                'commit_date', 'branch_name', 'version', 'changelog_b64'
+            ]
+            lines = ''.join(f"{key}={info[key]}\n" for key in safe_outputs if key in info)
             with open(github_output_path, 'a', encoding='utf-8') as f:
-                # 安全な出力のみ（Base64エンコードされたもの）
-                safe_outputs = [
-                    'commit_hash', 'commit_short', 'commit_message_b64', 
-                    'commit_date', 'branch_name', 'version', 'changelog_b64'
-                ]
-                for key in safe_outputs:
-                    if key in info:
-                        f.write(f"{key}={info[key]}\n")
+                f.write(lines)
         except Exception as e:
             print(f"GitHub出力ファイル書き込みエラー: {e}", file=sys.stderr)
     else:
@@ -111,5 +129,4 @@ def main():
 
 
 if __name__ == "__main__":
-    import os
     sys.exit(main())
@@ -16,12 +16,13 @@ __version__ = "0.1.1"
 __author__ = "drowsy_detection contributors"
 
 from drowsy_detection.config.config import Config
-from drowsy_detection.config.validators import InputData, OutputData
+from drowsy_detection.config.validators import InputData, OutputData, OutputBatch
 from drowsy_detection.core.drowsy_detector import DrowsyDetector
 
 __all__ = [
     "Config",
     "InputData",
     "OutputData",
+    "OutputBatch",
     "DrowsyDetector"
 ]
@@ -5,22 +5,96 @@ CLI エントリポイント
 """
 
 import argparse
+import copy
+import functools
+import itertools
 import json
+import os
+import queue
 import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple, TypeVar
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # orjson は任意依存（未導入時は標準 json を使用）
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # ijson は任意依存（未導入時はファイル全体を読み込み）
+    ijson = None
+
+try:
+    from pydantic import TypeAdapter
+except ImportError:  # pydantic v1 には TypeAdapter がない（要素ごとに検証）
+    TypeAdapter = None
 
 from drowsy_detection.config.config import Config
-from drowsy_detection.config.validators import InputData
+from drowsy_detection.config.validators import InputData, OutputBatch
 from drowsy_detection.core.drowsy_detector import DrowsyDetector
 
+# 一度に検出器へ渡すフレーム数
+BATCH_SIZE = 1000
+# 検証済みで検出待ちのバッチ数の上限
+PREFETCH_BATCHES = 4
+# 進捗表示の最小更新間隔 [s]
+PROGRESS_INTERVAL = 0.5
+# 入力ファイルの最上位が JSON 配列でない場合のエラーメッセージ
+NOT_ARRAY_ERROR = "Error: Input data must be a JSON array of frames"
+# サンプル設定ファイルの内容（Config のデフォルト値と同じ）
+SAMPLE_CONFIG = {
+    "left_eye_close_threshold": 0.105,
+    "right_eye_close_threshold": 0.105,
+    "continuous_close_time": 1.0,
+    "face_conf_threshold": 0.75,
+    "log_level": "INFO",
+    "enable_debug_log": False,
+    "enable_ema_filter": True,
+    "ema_alpha": 0.3
+}
+
+# 入力リスト全体を一度に検証するアダプタ（pydantic v2 のみ）
+_INPUT_LIST_ADAPTER = TypeAdapter(List[InputData]) if TypeAdapter is not None else None
+
+T = TypeVar("T")
+
+
+class InputDataError(ValueError):
+    """入力データの検証エラー"""
+
+
+def _loads_json(data: bytes) -> Any:
+    """JSON バイト列をデコード"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps_json(obj: Any) -> bytes:
+    """オブジェクトをインデント付き JSON (UTF-8) にエンコード"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(config_path: str, mtime_ns: int) -> Config:
+    """設定ファイルを読み込み（パスと更新時刻ごとにキャッシュ）"""
+    config_data = _loads_json(Path(config_path).read_bytes())
+    return Config(**config_data)
+
 
 def load_config(config_path: str) -> Config:
     """設定ファイルを読み込み"""
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config_data = json.load(f)
-        return Config(**config_data)
+        # 呼び出し側の変更がキャッシュに残らないよう複製を返す
+        return _load_config_cached(config_path, os.stat(config_path).st_mtime_ns).copy()
     except FileNotFoundError:
         print(f"Error: Configuration file not found: {config_path}")
         sys.exit(1)
@@ -32,19 +106,10 @@ def load_config(config_path: str) -> Config:
         sys.exit(1)
 
 
-def load_input_data(input_path: str) -> List[InputData]:
-    """入力データファイルを読み込み"""
+def load_raw_input(input_path: str) -> List[Dict[str, Any]]:
+    """入力データファイルを検証せずに読み込み"""
     try:
-        with open(input_path, 'r', encoding='utf-8') as f:
-            input_data_list = json.load(f)
-        parsed_data = []
-        for i, data in enumerate(input_data_list):
-            try:
-                parsed_data.append(InputData(**data))
-            except Exception as e:
-                print(f"Error parsing input data at index {i}: {e}")
-                sys.exit(1)
-        return parsed_data
+        return _loads_json(Path(input_path).read_bytes())
     except FileNotFoundError:
         print(f"Error: Input file not found: {input_path}")
         sys.exit(1)
@@ -53,60 +118,365 @@ def load_input_data(input_path: str) -> List[InputData]:
         sys.exit(1)
 
 
+def iter_raw_input(input_path: str) -> Iterator[Dict[str, Any]]:
+    """
+    入力データファイルを1件ずつ読み込み
+
+    拡張子が .jsonl の場合は1行1フレームの JSON Lines として読み込みます。
+    JSON 配列の場合、ijson が利用可能であればファイル全体をメモリに載せずに
+    逐次デコードします。
+    """
+    is_jsonl = Path(input_path).suffix.lower() == '.jsonl'
+    if ijson is None and not is_jsonl:
+        raw_input = load_raw_input(input_path)
+        if not isinstance(raw_input, list):
+            print(NOT_ARRAY_ERROR)
+            sys.exit(1)
+        return iter(raw_input)
+    try:
+        f = open(input_path, 'rb')
+    except FileNotFoundError:
+        print(f"Error: Input file not found: {input_path}")
+        sys.exit(1)
+    return _iter_json_lines(f) if is_jsonl else _iter_json_items(f)
+
+
+def _iter_json_lines(f) -> Iterator[Dict[str, Any]]:
+    """JSON Lines の各行を逐次デコード（空行は無視）"""
+    with f:
+        for line_num, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                yield _loads_json(line)
+            except json.JSONDecodeError as e:
+                raise InputDataError(f"Error: Invalid JSON in input file at line {line_num}: {e}") from e
+
+
+def _iter_json_items(f) -> Iterator[Dict[str, Any]]:
+    """JSON 配列の要素を逐次デコード"""
+    with f:
+        try:
+            # 最上位が配列でない場合は要素が0件として扱われるため、先頭のイベントで確認
+            first_event = next(ijson.parse(f), None)
+            if first_event is None or first_event[1] != 'start_array':
+                raise InputDataError(NOT_ARRAY_ERROR)
+            f.seek(0)
+            yield from ijson.items(f, 'item', use_float=True)
+        except ijson.JSONError as e:
+            raise InputDataError(f"Error: Invalid JSON in input file: {e}") from e
+
+
+def parse_input_batch(raw_items: List[Dict[str, Any]], offset: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    入力データを検証し、配列に変換
+
+    Args:
+        raw_items: 入力データの辞書リスト
+        offset: 先頭要素の入力ファイル内インデックス（エラー表示用）
+
+    Returns:
+        (フレーム番号配列, [左目開眼度, 右目開眼度, 顔検出信頼度] の N×3 配列)
+    """
+    columns = _extract_input_columns(raw_items)
+    if columns is not None and InputData.validate_batch(*columns):
+        return columns
+    # 型・値域の一括検証に通らない場合は要素ごとに検証（エラー報告・型変換を含む）
+    frame_nums = np.empty(len(raw_items), dtype=np.int64)
+    values = np.empty((len(raw_items), 3), dtype=np.float64)
+    for i, input_data in enumerate(_validate_input_list(raw_items, offset)):
+        frame_nums[i] = input_data.frame_num
+        values[i] = (input_data.left_eye_open, input_data.right_eye_open, input_data.face_confidence)
+    return frame_nums, values
+
+
+def iter_input_batches(
+    raw_input: Iterable[Dict[str, Any]],
+    batch_size: int = BATCH_SIZE
+) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """入力データを batch_size 件ずつ検証して配列で返す"""
+    raw_iter = iter(raw_input)
+    offset = 0
+    while True:
+        raw_items = list(itertools.islice(raw_iter, batch_size))
+        if not raw_items:
+            return
+        yield parse_input_batch(raw_items, offset=offset)
+        offset += len(raw_items)
+
+
+def _extract_input_columns(raw_items: List[Dict[str, Any]]) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    入力データの辞書リストを検証せずに配列化
+    
+    フレーム番号が int、各値が int/float の場合のみ配列を返します。
+    それ以外（キー欠落・文字列など）は None を返し、要素ごとの検証に委ねます。
+    
+    Args:
+        raw_items: 入力データの辞書リスト
+        
+    Returns:
+        (フレーム番号配列, N×3 配列)、または None
+    """
+    try:
+        rows = [
+            (d["frame_num"], d["left_eye_open"], d["right_eye_open"], d["face_confidence"])
+            for d in raw_items
+        ]
+    except (KeyError, TypeError):
+        return None
+    if not rows:
+        return np.empty(0, dtype=np.int64), np.empty((0, 3), dtype=np.float64)
+    frame_col, left_col, right_col, face_col = zip(*rows)
+    if not set(map(type, frame_col)) <= {int}:
+        return None
+    if not set(map(type, itertools.chain(left_col, right_col, face_col))) <= {int, float}:
+        return None
+    try:
+        frame_nums = np.array(frame_col, dtype=np.int64)
+    except OverflowError:
+        return None
+    values = np.empty((len(rows), 3), dtype=np.float64)
+    values[:, 0] = left_col
+    values[:, 1] = right_col
+    values[:, 2] = face_col
+    return frame_nums, values
+
+
+def _validate_input_list(raw_items: List[Dict[str, Any]], offset: int = 0) -> List[InputData]:
+    """
+    入力データの辞書リストをまとめて検証
+    
+    Args:
+        raw_items: 入力データの辞書リスト
+        offset: 先頭要素の入力ファイル内インデックス（エラー表示用）
+        
+    Returns:
+        検証済みの入力データリスト
+    """
+    if _INPUT_LIST_ADAPTER is not None:
+        try:
+            return _INPUT_LIST_ADAPTER.validate_python(raw_items)
+        except Exception:
+            pass  # 失敗時は要素ごとに検証し直し、従来と同じエラーを報告
+    parsed_data = []
+    for i, data in enumerate(raw_items):
+        try:
+            parsed_data.append(InputData(**data))
+        except Exception as e:
+            raise InputDataError(f"Error parsing input data at index {offset + i}: {e}") from e
+    return parsed_data
+
+
+def split_sessions(frame_nums: np.ndarray) -> List[slice]:
+    """
+    フレーム番号が増加しなくなった位置でセッションに分割
+
+    Args:
+        frame_nums: フレーム番号配列
+
+    Returns:
+        各セッションの範囲
+    """
+    bounds = [0, *(np.flatnonzero(np.diff(frame_nums) <= 0) + 1).tolist(), len(frame_nums)]
+    return [slice(start, end) for start, end in zip(bounds[:-1], bounds[1:]) if end > start]
+
+
+# ワーカープロセスの検出器の雛形（_init_session_worker で生成）
+_worker_template: Optional[DrowsyDetector] = None
+
+
+def _init_session_worker(config_data: Dict[str, Any]) -> None:
+    """
+    ワーカープロセスの検出器の雛形を生成
+
+    初期化ログはワーカーごとに重複するため出力せず、
+    デバッグログファイルも複数プロセスから同時に開かないよう無効にします。
+    """
+    global _worker_template
+    quiet_config = Config(**{**config_data, "log_level": "WARNING", "enable_debug_log": False})
+    _worker_template = DrowsyDetector(quiet_config)
+    _worker_template.logger.set_level(config_data["log_level"])
+
+
+def _process_session(
+    frame_nums: np.ndarray,
+    values: np.ndarray,
+    template: Optional[DrowsyDetector] = None
+) -> OutputBatch:
+    """1セッションを初期状態の検出器で処理（ワーカープロセスからも呼び出される）"""
+    # 雛形の複製を使い、セッションごとのロガー再設定と初期化ログを避ける
+    detector = copy.deepcopy(template if template is not None else _worker_template)
+    return detector.update_batch(frame_nums, values[:, 0], values[:, 1], values[:, 2])
+
+
+def process_sessions(
+    config: Config,
+    frame_nums: np.ndarray,
+    values: np.ndarray,
+    jobs: int = 1
+) -> List[OutputBatch]:
+    """
+    セッションごとに独立した検出器で処理
+
+    並列実行時のワーカープロセスは初期化ログとデバッグログファイルを出力しません。
+
+    Args:
+        config: 設定
+        frame_nums: フレーム番号配列
+        values: [左目開眼度, 右目開眼度, 顔検出信頼度] の N×3 配列
+        jobs: 並列実行するプロセス数（0 以下で CPU コア数）
+
+    Returns:
+        入力順に並んだセッションごとの判定結果
+    """
+    sessions = split_sessions(frame_nums)
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+    if jobs == 1 or len(sessions) <= 1:
+        template = DrowsyDetector(config)
+        return [_process_session(frame_nums[s], values[s], template) for s in sessions]
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(sessions)),
+        initializer=_init_session_worker,
+        initargs=(config.dict(),)
+    ) as executor:
+        return list(executor.map(
+            _process_session, [frame_nums[s] for s in sessions], [values[s] for s in sessions]
+        ))
+
+
+def _prefetch(items: Iterable[T], maxsize: int = PREFETCH_BATCHES) -> Iterator[T]:
+    """
+    別スレッドで items を先読みしながら順に返す
+
+    生成側で発生した例外は呼び出し側で再送出します。
+    """
+    buffer: "queue.Queue[Tuple[bool, Any]]" = queue.Queue(maxsize=maxsize)
+    stop = threading.Event()
+
+    def produce() -> None:
+        try:
+            for item in items:
+                if stop.is_set():
+                    return
+                buffer.put((False, item))
+        except BaseException as e:
+            buffer.put((True, e))
+            return
+        buffer.put((True, None))
+
+    producer = threading.Thread(target=produce, name="input-prefetch", daemon=True)
+    producer.start()
+    try:
+        while True:
+            done, item = buffer.get()
+            if done:
+                if item is not None:
+                    raise item
+                return
+            yield item
+    finally:
+        stop.set()
+        # 生成側が put で待機している場合に備えて空にする
+        while producer.is_alive():
+            try:
+                buffer.get(timeout=0.1)
+            except queue.Empty:
+                pass
+
+
+def _iter_json_array_chunks(record_batches: Iterable[List[Dict[str, Any]]]) -> Iterator[bytes]:
+    """
+    辞書リストの列を1つの JSON 配列として逐次エンコード
+
+    連結すると全要素をまとめて _dumps_json した結果と同じバイト列になります。
+    """
+    first = True
+    for records in record_batches:
+        if not records:
+            continue
+        # 各バッチの "[\n" と "\n]" を除いた要素部分をつなげる
+        yield (b"[\n" if first else b",\n") + _dumps_json(records)[2:-2]
+        first = False
+    yield b"[]" if first else b"\n]"
+
+
 def save_results(results: List[Dict[Any, Any]], output_path: str) -> None:
     """結果をファイルに保存"""
+    save_result_batches([results], output_path)
+
+
+def save_result_batches(record_batches: Iterable[List[Dict[str, Any]]], output_path: str) -> None:
+    """
+    バッチごとの結果を順に変換しながら1つの JSON 配列としてファイルに保存
+
+    全フレーム分の辞書を同時に保持しないため、メモリ使用量はバッチサイズ程度に収まります。
+
+    Args:
+        record_batches: バッチごとの結果辞書リスト（遅延生成可）
+        output_path: 出力ファイルパス
+    """
     try:
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        with open(output_path, 'wb') as f:
+            for chunk in _iter_json_array_chunks(record_batches):
+                f.write(chunk)
         print(f"Results saved to: {output_path}")
     except Exception as e:
         print(f"Error saving results: {e}")
         sys.exit(1)
 
 
-def print_summary(results: List[Dict[Any, Any]]) -> None:
+def print_summary(results: OutputBatch) -> None:
     """結果の要約を表示"""
     total_frames = len(results)
-    drowsy_frames = sum(1 for r in results if r.get('is_drowsy') == 1)
-    error_frames = sum(1 for r in results if r.get('is_drowsy') == -1)
-    normal_frames = total_frames - drowsy_frames - error_frames
+    # is_drowsy (-1, 0, 1) を 1回の走査で集計
+    error_frames, normal_frames, drowsy_frames = np.bincount(
+        results.is_drowsy.astype(np.intp) + 1, minlength=3
+    ).tolist()
     print("\n=== 処理結果サマリ ===")
-    print(f"総フレーム数: {total_frames}")
-    print(f"正常フレーム: {normal_frames} ({normal_frames/total_frames*100:.1f}%)")
-    print(f"眠気検知フレーム: {drowsy_frames} ({drowsy_frames/total_frames*100:.1f}%)")
-    print(f"エラーフレーム: {error_frames} ({error_frames/total_frames*100:.1f}%)")
+    if total_frames == 0:
+        print("総フレーム数: 0（処理対象のフレームがありません）")
+        return
+    scale = 100.0 / total_frames
+    print(
+        f"総フレーム数: {total_frames}\n"
+        f"正常フレーム: {normal_frames} ({normal_frames * scale:.1f}%)\n"
+        f"眠気検知フレーム: {drowsy_frames} ({drowsy_frames * scale:.1f}%)\n"
+        f"エラーフレーム: {error_frames} ({error_frames * scale:.1f}%)"
+    )
     if drowsy_frames > 0:
         print(f"\n⚠️  眠気が検知されました！")
 
 
 def create_sample_config(output_path: str) -> None:
     """サンプル設定ファイルを作成"""
-    config = Config()
-    config_dict = config.dict()
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(config_dict, f, indent=2, ensure_ascii=False)
+    Path(output_path).write_bytes(_dumps_json(SAMPLE_CONFIG))
     print(f"Sample configuration file created: {output_path}")
 
 
 def create_sample_input(output_path: str, num_frames: int = 100) -> None:
     """サンプル入力ファイルを作成"""
-    import random
-    sample_data = []
-    for i in range(num_frames):
-        if i % 50 < 10:
-            left_eye = random.uniform(0.0, 0.2)
-            right_eye = random.uniform(0.0, 0.2)
-        else:
-            left_eye = random.uniform(0.5, 1.0)
-            right_eye = random.uniform(0.5, 1.0)
-        sample_data.append({
-            "frame_num": i + 1,
-            "left_eye_open": left_eye,
-            "right_eye_open": right_eye,
-            "face_confidence": random.uniform(0.8, 1.0)
-        })
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(sample_data, f, indent=2, ensure_ascii=False)
+    rng = np.random.default_rng()
+    # 50 フレーム周期のうち先頭 10 フレームを閉眼区間とする
+    closed = (np.arange(num_frames) % 50) < 10
+    low = np.where(closed, 0.0, 0.5)
+    high = np.where(closed, 0.2, 1.0)
+    left_eye = rng.uniform(low, high)
+    right_eye = rng.uniform(low, high)
+    face_conf = rng.uniform(0.8, 1.0, num_frames)
+    sample_data = [
+        {
+            "frame_num": i,
+            "left_eye_open": left,
+            "right_eye_open": right,
+            "face_confidence": face
+        }
+        for i, left, right, face in zip(
+            range(1, num_frames + 1), left_eye.tolist(), right_eye.tolist(), face_conf.tolist()
+        )
+    ]
+    Path(output_path).write_bytes(_dumps_json(sample_data))
     print(f"Sample input file created: {output_path} ({num_frames} frames)")
 
 
@@ -118,6 +488,7 @@ def main():
 使用例:
   drowsy-detect --input data.json
   drowsy-detect --config config.json --input data.json --output result.json
+  drowsy-detect --input sessions.json --split-sessions --jobs 4
   
   # サンプルファイルを生成
   drowsy-detect --create-sample-config config.json
@@ -125,12 +496,16 @@ def main():
         """
     )
     parser.add_argument("--config", type=str, help="設定ファイルパス (.json)")
-    parser.add_argument("--input", type=str, help="入力JSONファイルパス")
+    parser.add_argument("--input", type=str, help="入力JSONファイルパス（.jsonl は JSON Lines）")
     parser.add_argument("--output", type=str, help="出力JSONファイルパス")
     parser.add_argument("--verbose", "-v", action="store_true", help="詳細ログを表示")
     parser.add_argument("--create-sample-config", type=str, help="サンプル設定ファイルを作成")
     parser.add_argument("--create-sample-input", type=str, help="サンプル入力ファイルを作成")
     parser.add_argument("--frames", type=int, default=100, help="サンプル入力のフレーム数")
+    parser.add_argument("--split-sessions", action="store_true",
+                        help="フレーム番号が増加しなくなった位置を別セッションとして独立に処理")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="--split-sessions 時に並列実行するプロセス数（0 で CPU コア数）")
     args = parser.parse_args()
 
     if args.create_sample_config:
@@ -151,31 +526,61 @@ def main():
         config.enable_debug_log = True
 
     try:
-        detector = DrowsyDetector(config)
+        # --split-sessions 時の検出器は process_sessions がプロセスごとに生成
+        detector = None if args.split_sessions else DrowsyDetector(config)
         print(f"DrowsyDetector initialized with {config.dict()}")
     except Exception as e:
         print(f"Error initializing detector: {e}")
         sys.exit(1)
 
-    input_data_list = load_input_data(args.input)
-    print(f"Loaded {len(input_data_list)} frames from {args.input}")
+    raw_input = iter_raw_input(args.input)
 
-    results = []
+    batches = []
+    num_processed = 0
     try:
-        for i, input_data in enumerate(input_data_list):
-            result = detector.update(input_data)
-            results.append(result.dict())
-            if (i + 1) % 100 == 0 or (i + 1) == len(input_data_list):
-                print(f"Processed {i + 1}/{len(input_data_list)} frames")
+        if args.split_sessions:
+            frame_nums, values = parse_input_batch(list(raw_input))
+            num_processed = len(frame_nums)
+            print(f"Loaded {num_processed} frames from {args.input}")
+            print(f"Detected {len(split_sessions(frame_nums))} sessions")
+            batches = process_sessions(config, frame_nums, values, jobs=args.jobs)
+        else:
+            # 入力の読み込み・検証（別スレッド）と検出処理を並行して実行
+            last_progress = time.monotonic()
+            progress = ""
+            for frame_nums, values in _prefetch(iter_input_batches(raw_input)):
+                batches.append(
+                    detector.update_batch(frame_nums, values[:, 0], values[:, 1], values[:, 2])
+                )
+                num_processed += len(frame_nums)
+                # 総フレーム数は読み込み完了まで不明のため、途中経過は一定間隔ごとに同じ行へ上書き表示
+                now = time.monotonic()
+                if now - last_progress >= PROGRESS_INTERVAL:
+                    progress = f"Processing... {num_processed} frames"
+                    sys.stdout.write(f"\r{progress}")
+                    sys.stdout.flush()
+                    last_progress = now
+            if progress:
+                sys.stdout.write("\r" + " " * len(progress) + "\r")
+            print(f"Loaded {num_processed} frames from {args.input}")
+        print(f"Processed {num_processed}/{num_processed} frames")
+    except InputDataError as e:
+        print(e)
+        sys.exit(1)
     except Exception as e:
         print(f"Error during processing: {e}")
         sys.exit(1)
 
+    # 辞書への変換は出力時のみ行う
+    results = OutputBatch.concatenate(batches)
     if args.output:
-        save_results(results, args.output)
+        save_result_batches(
+            (results[i:i + BATCH_SIZE].to_dicts() for i in range(0, len(results), BATCH_SIZE)),
+            args.output
+        )
     else:
         print("\n=== 処理結果 (最初の10件) ===")
-        for result in results[:10]:
+        for result in results[:10].to_dicts():
             print(json.dumps(result, ensure_ascii=False))
         if len(results) > 10:
             print(f"... and {len(results) - 10} more results")
@@ -5,12 +5,13 @@
 """
 
 from .config import Config, ConfigValidator
-from .validators import InputData, OutputData, ProcessedData
+from .validators import InputData, OutputData, OutputBatch, ProcessedData
 
 __all__ = [
     "Config",
     "ConfigValidator",
     "InputData",
     "OutputData",
+    "OutputBatch",
     "ProcessedData"
 ]
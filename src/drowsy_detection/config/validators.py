@@ -5,9 +5,10 @@
 """
 
 from pydantic import BaseModel, Field, validator
-from typing import Optional
+import math
+from typing import Optional, List, Dict, Any
 import numpy as np
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 
 
 class InputData(BaseModel):
@@ -42,9 +43,23 @@ class InputData(BaseModel):
     @validator('left_eye_open', 'right_eye_open', 'face_confidence')
     def validate_float_values(cls, v):
         """浮動小数点値の妥当性を検証"""
-        if np.isnan(v):
+        if math.isnan(v):
             raise ValueError("Input values cannot be NaN")
         return v
+    
+    @classmethod
+    def validate_batch(cls, frame_nums: np.ndarray, values: np.ndarray) -> bool:
+        """
+        配列化済みの入力データの値域をまとめて検証
+        
+        Args:
+            frame_nums: フレーム番号配列
+            values: [左目開眼度, 右目開眼度, 顔検出信頼度] の N×3 配列
+            
+        Returns:
+            全フレームが制約を満たす場合 True（NaN を含む場合は False）
+        """
+        return bool(np.all(frame_nums >= 0) and np.all((values >= 0.0) & (values <= 1.0)))
 
 
 class OutputData(BaseModel):
@@ -77,9 +92,20 @@ class OutputData(BaseModel):
         if v not in valid_values:
             raise ValueError(f"is_drowsy must be one of {valid_values}")
         return v
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """dict() と同じ内容の辞書を、フィールドを直接参照して生成"""
+        return {
+            'is_drowsy': self.is_drowsy,
+            'frame_num': self.frame_num,
+            'left_eye_closed': self.left_eye_closed,
+            'right_eye_closed': self.right_eye_closed,
+            'continuous_time': self.continuous_time,
+            'error_code': self.error_code
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessedData:
     """前処理済みデータクラス"""
     left_eye_open: float
@@ -95,3 +121,77 @@ class ProcessedData:
             raise ValueError("right_eye_open must be between 0.0 and 1.0")
         if not (0.0 <= self.face_confidence <= 1.0):
             raise ValueError("face_confidence must be between 0.0 and 1.0")
+    
+    @classmethod
+    def construct(cls, left_eye_open: float, right_eye_open: float, face_confidence: float) -> "ProcessedData":
+        """
+        検証を省略して生成（0.0〜1.0 に制限済みの値専用）
+        
+        Args:
+            left_eye_open: 左目の開眼度
+            right_eye_open: 右目の開眼度
+            face_confidence: 顔検出信頼度
+            
+        Returns:
+            前処理済みデータ
+        """
+        data = cls.__new__(cls)
+        data.left_eye_open = left_eye_open
+        data.right_eye_open = right_eye_open
+        data.face_confidence = face_confidence
+        return data
+
+
+@dataclass
+class OutputBatch:
+    """バッチ処理の判定結果（フィールドごとの配列）"""
+    is_drowsy: np.ndarray
+    frame_num: np.ndarray
+    left_eye_closed: np.ndarray
+    right_eye_closed: np.ndarray
+    continuous_time: np.ndarray
+    error_code: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.frame_num)
+    
+    def __getitem__(self, index: slice) -> "OutputBatch":
+        return OutputBatch(**{f.name: getattr(self, f.name)[index] for f in fields(self)})
+    
+    @classmethod
+    def concatenate(cls, batches: List["OutputBatch"]) -> "OutputBatch":
+        """複数のバッチ結果を1つに連結"""
+        if not batches:
+            return cls(
+                is_drowsy=np.empty(0, dtype=np.int8),
+                frame_num=np.empty(0, dtype=np.int64),
+                left_eye_closed=np.empty(0, dtype=bool),
+                right_eye_closed=np.empty(0, dtype=bool),
+                continuous_time=np.empty(0, dtype=np.float64),
+                error_code=np.empty(0, dtype=object)
+            )
+        return cls(**{
+            f.name: np.concatenate([getattr(batch, f.name) for batch in batches])
+            for f in fields(cls)
+        })
+    
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """OutputData.dict() と同じ形式の辞書リストに変換"""
+        return [
+            {
+                'is_drowsy': is_drowsy,
+                'frame_num': frame_num,
+                'left_eye_closed': left_closed,
+                'right_eye_closed': right_closed,
+                'continuous_time': continuous_time,
+                'error_code': error_code
+            }
+            for is_drowsy, frame_num, left_closed, right_closed, continuous_time, error_code in zip(
+                self.is_drowsy.tolist(),
+                self.frame_num.tolist(),
+                self.left_eye_closed.tolist(),
+                self.right_eye_closed.tolist(),
+                self.continuous_time.tolist(),
+                self.error_code.tolist()
+            )
+        ]
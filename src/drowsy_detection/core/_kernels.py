@@ -0,0 +1,193 @@
+"""
+数値計算カーネルモジュール
+
+バッチ処理の逐次ループ部分を提供します。
+numba が利用可能な場合はネイティブコードにコンパイルし、
+未導入の場合は同じ関数を Python のまま実行します。
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba は任意依存（未導入時は Python 実装のまま実行）
+    def njit(*args, **kwargs):
+        """numba.njit 互換の何もしないデコレータ"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def ema_step(value, alpha, initialized, filtered_value):
+    """
+    指数移動平均フィルタを1サンプル分更新
+
+    EyeStateManager._apply_ema_filter と同じ漸化式です。
+
+    Args:
+        value: 入力値
+        alpha: EMA フィルタ係数
+        initialized: フィルタ初期化済みフラグ
+        filtered_value: 更新前のフィルタ値
+
+    Returns:
+        更新後のフィルタ値（未初期化の場合は入力値）
+    """
+    if not initialized:
+        return value
+    return alpha * value + (1 - alpha) * filtered_value
+
+
+@njit(cache=True)
+def timer_step(closed, dt, timer_active, duration):
+    """
+    連続閉眼時間タイマーを1フレーム分更新
+
+    ContinuousTimer の start / update / stop と同じ遷移です。
+
+    Args:
+        closed: 両目閉眼フラグ
+        dt: フレーム間隔 [s]
+        timer_active: タイマー動作中フラグ
+        duration: 更新前の継続時間 [s]
+
+    Returns:
+        更新後の (タイマー動作中フラグ, 継続時間)
+    """
+    if not closed:
+        return False, 0.0
+    if not timer_active:
+        duration = 0.0
+    return True, duration + dt
+
+
+@njit(cache=True)
+def scan_states(
+    left_eye,
+    right_eye,
+    reset,
+    out_idx,
+    left_closed,
+    right_closed,
+    durations,
+    drowsy,
+    enable_filter,
+    alpha,
+    left_threshold,
+    right_threshold,
+    time_threshold,
+    dt,
+    left_value,
+    right_value,
+    initialized,
+    timer_active,
+    duration
+):
+    """
+    目の状態（EMA フィルタ・閉眼判定）とタイマーをフレーム順に更新
+
+    判定結果は呼び出し側が確保した出力配列の out_idx の位置に書き込みます。
+
+    Args:
+        left_eye: 前処理済みの左目開眼度配列
+        right_eye: 前処理済みの右目開眼度配列
+        reset: 処理前に状態をリセットするフレームのマスク
+        out_idx: 各フレームの結果を書き込む出力配列上の位置
+        left_closed: 左目閉眼フラグの出力配列
+        right_closed: 右目閉眼フラグの出力配列
+        durations: 連続閉眼時間の出力配列 [s]
+        drowsy: 眠気判定結果の出力配列
+        enable_filter: EMA フィルタ有効化フラグ
+        alpha: EMA フィルタ係数
+        left_threshold: 左目の閉眼判定閾値
+        right_threshold: 右目の閉眼判定閾値
+        time_threshold: 連続閉眼時間閾値 [s]
+        dt: フレーム間隔 [s]
+        left_value: 左目フィルタ値の初期状態
+        right_value: 右目フィルタ値の初期状態
+        initialized: フィルタ初期化済みフラグの初期状態
+        timer_active: タイマー動作中フラグの初期状態
+        duration: 連続閉眼時間の初期状態 [s]
+
+    Returns:
+        処理後の (左目フィルタ値, 右目フィルタ値, フィルタ初期化済みフラグ,
+        タイマー動作中フラグ, 連続閉眼時間)
+    """
+    for k in range(left_eye.shape[0]):
+        left = left_eye[k]
+        right = right_eye[k]
+        if reset[k]:
+            initialized = False
+            timer_active = False
+            duration = 0.0
+        if enable_filter:
+            left_value = ema_step(left, alpha, initialized, left_value)
+            right_value = ema_step(right, alpha, initialized, right_value)
+            initialized = True
+            left_is_closed = left_value <= left_threshold
+            right_is_closed = right_value <= right_threshold
+        else:
+            left_is_closed = left <= left_threshold
+            right_is_closed = right <= right_threshold
+        i = out_idx[k]
+        timer_active, duration = timer_step(left_is_closed and right_is_closed, dt, timer_active, duration)
+        drowsy[i] = 1 if timer_active and duration >= time_threshold else 0
+        left_closed[i] = left_is_closed
+        right_closed[i] = right_is_closed
+        durations[i] = duration
+
+    return left_value, right_value, initialized, timer_active, duration
+
+
+@njit(cache=True)
+def scan_timer(closed, threshold, dt, timer_active, duration):
+    """
+    閉眼フラグ列に沿って連続閉眼時間タイマーを更新
+
+    Args:
+        closed: 両目閉眼フラグ配列
+        threshold: 閾値時間 [s]
+        dt: フレーム間隔 [s]
+        timer_active: タイマー動作中フラグの初期状態
+        duration: 継続時間の初期状態 [s]
+
+    Returns:
+        (継続時間, 閾値超過フラグ) の配列と、
+        処理後の (タイマー動作中フラグ, 継続時間)
+    """
+    m = closed.shape[0]
+    durations = np.zeros(m, dtype=np.float64)
+    exceeded = np.zeros(m, dtype=np.bool_)
+
+    for k in range(m):
+        timer_active, duration = timer_step(closed[k], dt, timer_active, duration)
+        durations[k] = duration
+        exceeded[k] = duration >= threshold
+
+    return durations, exceeded, timer_active, duration
+
+
+@njit(cache=True)
+def ema_filter(values, alpha, initialized, filtered_value):
+    """
+    指数移動平均フィルタを配列に順に適用
+
+    Args:
+        values: 入力値配列
+        alpha: EMA フィルタ係数
+        initialized: フィルタ初期化済みフラグの初期状態
+        filtered_value: フィルタ値の初期状態
+
+    Returns:
+        フィルタ済み値の配列と、処理後の (フィルタ初期化済みフラグ, フィルタ値)
+    """
+    m = values.shape[0]
+    filtered = np.empty(m, dtype=np.float64)
+
+    for k in range(m):
+        filtered_value = ema_step(values[k], alpha, initialized, filtered_value)
+        initialized = True
+        filtered[k] = filtered_value
+
+    return filtered, initialized, filtered_value
@@ -4,11 +4,13 @@
 開眼度と顔検出信頼度を入力として、連続閉眼状態を検知します。
 """
 
-from typing import Optional
+from typing import Optional, Tuple
+import logging
 import time
+import numpy as np
 from drowsy_detection.config.config import Config
-from drowsy_detection.config.validators import InputData, OutputData
-from drowsy_detection.core.eye_state import EyeStateManager, EyeState
+from drowsy_detection.config.validators import InputData, OutputData, OutputBatch
+from drowsy_detection.core.eye_state import EyeStateManager
 from drowsy_detection.core.timer import ContinuousTimer
 from drowsy_detection.utils.logger import Logger
 from drowsy_detection.utils.data_processor import DataProcessor
@@ -17,6 +19,12 @@ from drowsy_detection.utils.data_processor import DataProcessor
 class DrowsyDetector:
     """連続閉眼検知アルゴリズムメインクラス"""
     
+    __slots__ = (
+        'config', 'face_conf_threshold', 'logger',
+        'left_eye_manager', 'right_eye_manager', 'timer', 'data_processor',
+        'last_frame_num', '_last_valid', '_frame_rate', 'frame_interval'
+    )
+    
     def __init__(self, config: Config):
         """
         連続閉眼検知器を初期化
@@ -25,6 +33,8 @@ class DrowsyDetector:
             config: 設定オブジェクト
         """
         self.config = config
+        # 顔検出信頼度閾値（フレームごとの設定モデル属性参照を避けるため float で保持）
+        self.face_conf_threshold = float(config.face_conf_threshold)
         self.logger = Logger(config.log_level, config.enable_debug_log)
         
         # 目の状態管理
@@ -47,10 +57,12 @@ class DrowsyDetector:
         
         # 状態管理
         self.last_frame_num = -1
-        self.last_valid_result: Optional[OutputData] = None
+        self._last_valid: Optional[Tuple[int, int, bool, bool, float]] = None
         self.frame_rate = 30.0  # フレームレート（デフォルト30fps）
         
-        self.logger.info(f"DrowsyDetector initialized with config: {config.dict()}")
+        # 設定の辞書化は INFO ログが出力される場合のみ行う
+        if self.logger.is_enabled_for(logging.INFO):
+            self.logger.info("DrowsyDetector initialized with config: %s", config.dict())
     
     def update(self, input_data: InputData) -> OutputData:
         """
@@ -62,139 +74,498 @@ class DrowsyDetector:
         Returns:
             判定結果
         """
-        start_time = time.time()
+        return self.update_raw(
+            input_data.frame_num,
+            input_data.left_eye_open,
+            input_data.right_eye_open,
+            input_data.face_confidence
+        )
+    
+    def update_raw(
+        self,
+        frame_num: int,
+        left_eye_open: float,
+        right_eye_open: float,
+        face_confidence: float
+    ) -> OutputData:
+        """
+        アルゴリズム更新処理（InputData を介さない版）
+        
+        検証済みの値を逐次処理する場合に、フレームごとの InputData 生成・検証を省略できます。
+        
+        Args:
+            frame_num: フレーム番号
+            left_eye_open: 左目の開眼度
+            right_eye_open: 右目の開眼度
+            face_confidence: 顔検出信頼度
+            
+        Returns:
+            判定結果
+        """
+        is_drowsy, left_eye_closed, right_eye_closed, continuous_time, error_code = self._process(
+            frame_num, left_eye_open, right_eye_open, face_confidence
+        )
+        return OutputData(
+            is_drowsy=is_drowsy,
+            frame_num=frame_num,
+            left_eye_closed=left_eye_closed,
+            right_eye_closed=right_eye_closed,
+            continuous_time=continuous_time,
+            error_code=error_code
+        )
+    
+    def _process(
+        self,
+        frame_num: int,
+        left_eye_open: float,
+        right_eye_open: float,
+        face_confidence: float
+    ) -> Tuple[int, bool, bool, float, Optional[str]]:
+        """
+        1フレーム分の判定処理本体
+        
+        Args:
+            frame_num: フレーム番号
+            left_eye_open: 左目の開眼度
+            right_eye_open: 右目の開眼度
+            face_confidence: 顔検出信頼度
+            
+        Returns:
+            (眠気判定結果, 左目閉眼フラグ, 右目閉眼フラグ, 連続閉眼時間, エラーコード)
+        """
+        debug_enabled = self.logger.debug_enabled
+        start_time = time.perf_counter() if debug_enabled else 0.0
         
         try:
             # フレーム番号チェック
-            if input_data.frame_num <= self.last_frame_num:
-                self.logger.warning(f"Invalid frame number: {input_data.frame_num} <= {self.last_frame_num}")
-                return self._create_error_output(input_data.frame_num, "INVALID_FRAME_NUM")
+            if frame_num <= self.last_frame_num:
+                self.logger.warning("Invalid frame number: %s <= %s", frame_num, self.last_frame_num)
+                return -1, False, False, 0.0, "INVALID_FRAME_NUM"
             
             # 顔検出信頼度チェック
-            if input_data.face_confidence < self.config.face_conf_threshold:
-                self.logger.debug(f"Low face confidence: {input_data.face_confidence} < {self.config.face_conf_threshold}")
+            if face_confidence < self.face_conf_threshold:
+                if debug_enabled:
+                    self.logger.debug("Low face confidence: %s < %s", face_confidence, self.face_conf_threshold)
                 self._reset_state()
-                return self._create_error_output(input_data.frame_num, "LOW_FACE_CONFIDENCE")
+                return -1, False, False, 0.0, "LOW_FACE_CONFIDENCE"
             
             # データ前処理
-            processed_data = self.data_processor.preprocess(input_data)
+            processed_data = self.data_processor.preprocess_values(
+                left_eye_open, right_eye_open, face_confidence
+            )
             
             # 目の状態更新
-            left_eye_state = self.left_eye_manager.update(processed_data.left_eye_open)
-            right_eye_state = self.right_eye_manager.update(processed_data.right_eye_open)
+            left_eye_closed, right_eye_closed = self._update_eye_states(
+                processed_data.left_eye_open,
+                processed_data.right_eye_open
+            )
             
             # 連続閉眼判定
-            result = self._evaluate_drowsy_state(
-                input_data.frame_num,
-                left_eye_state,
-                right_eye_state
+            is_drowsy, continuous_time = self._evaluate_drowsy_state(
+                frame_num,
+                left_eye_closed,
+                right_eye_closed
             )
+            left_eye_closed = bool(left_eye_closed)
+            right_eye_closed = bool(right_eye_closed)
             
-            # 状態更新
-            self.last_frame_num = input_data.frame_num
-            self.last_valid_result = result
-            
-            # パフォーマンスログ
-            duration = time.time() - start_time
-            self.logger.log_performance("update", duration)
+            # 状態更新（最終有効結果は参照時に OutputData 化する）
+            self.last_frame_num = frame_num
+            self._last_valid = (is_drowsy, frame_num, left_eye_closed, right_eye_closed, continuous_time)
             
-            self.logger.debug(f"Frame {input_data.frame_num}: is_drowsy={result.is_drowsy}, "
-                            f"left_closed={result.left_eye_closed}, right_closed={result.right_eye_closed}, "
-                            f"continuous_time={result.continuous_time:.2f}s")
+            # パフォーマンス・デバッグログ（DEBUG 無効時はメッセージを生成しない）
+            if debug_enabled:
+                self.logger.log_performance("update", time.perf_counter() - start_time)
+                self.logger.debug(
+                    "Frame %s: is_drowsy=%s, left_closed=%s, right_closed=%s, continuous_time=%.2fs",
+                    frame_num, is_drowsy, left_eye_closed, right_eye_closed, continuous_time
+                )
             
-            return result
+            return is_drowsy, left_eye_closed, right_eye_closed, continuous_time, None
             
         except Exception as e:
-            self.logger.error(f"Error in update: {str(e)}")
-            return self._create_error_output(input_data.frame_num, "INTERNAL_ERROR")
+            self.logger.error("Error in update: %s", e)
+            return -1, False, False, 0.0, "INTERNAL_ERROR"
+    
+    def update_batch(
+        self,
+        frame_nums: np.ndarray,
+        left_eye_open: np.ndarray,
+        right_eye_open: np.ndarray,
+        face_confidence: np.ndarray
+    ) -> OutputBatch:
+        """
+        複数フレームをまとめて更新
+        
+        update をフレーム順に呼び出した場合と同じ判定結果・内部状態になります。
+        入力値の検証は行わないため、NaN は前処理で直前の有効値に補完されます。
+        フレームごとの WARNING・INFO ログは判定後にフレーム順で出力し、
+        DEBUG ログ有効時は update と同じログを出力するため1フレームずつ処理します。
+        
+        Args:
+            frame_nums: フレーム番号配列
+            left_eye_open: 左目の開眼度配列
+            right_eye_open: 右目の開眼度配列
+            face_confidence: 顔検出信頼度配列
+            
+        Returns:
+            判定結果（フィールドごとの配列）
+        """
+        frame_nums = np.asarray(frame_nums, dtype=np.int64)
+        left_eye_open = np.asarray(left_eye_open, dtype=np.float64)
+        right_eye_open = np.asarray(right_eye_open, dtype=np.float64)
+        face_confidence = np.asarray(face_confidence, dtype=np.float64)
+        n = len(frame_nums)
+        if not (len(left_eye_open) == len(right_eye_open) == len(face_confidence) == n):
+            raise ValueError("All input arrays must have the same length")
+        
+        if self.logger.debug_enabled:
+            return self._update_batch_sequential(frame_nums, left_eye_open, right_eye_open, face_confidence)
+        
+        last_frame_num = self.last_frame_num
+        is_drowsy = np.zeros(n, dtype=np.int8)
+        left_eye_closed = np.zeros(n, dtype=bool)
+        right_eye_closed = np.zeros(n, dtype=bool)
+        continuous_time = np.zeros(n, dtype=np.float64)
+        error_code = np.full(n, None, dtype=object)
+        
+        # フレーム番号・顔検出信頼度チェック
+        invalid_frame = self._check_frame_order(frame_nums, face_confidence)
+        low_face = ~invalid_frame & (face_confidence < self.face_conf_threshold)
+        accepted = ~(invalid_frame | low_face)
+        is_drowsy[~accepted] = -1
+        error_code[invalid_frame] = "INVALID_FRAME_NUM"
+        error_code[low_face] = "LOW_FACE_CONFIDENCE"
+        
+        # 有効フレームのみ前処理
+        left_eye, right_eye, _ = self.data_processor.preprocess_batch(
+            left_eye_open[accepted],
+            right_eye_open[accepted],
+            face_confidence[accepted]
+        )
+        
+        # 直前の有効フレームとの間に低信頼度フレームがあれば状態をリセット
+        low_face_count = np.cumsum(low_face)
+        accepted_low_face_count = low_face_count[accepted]
+        reset = np.diff(accepted_low_face_count, prepend=0) > 0
+        accepted_idx = np.flatnonzero(accepted)
+        
+        self._scan_states(
+            left_eye, right_eye, reset, accepted_idx,
+            left_eye_closed, right_eye_closed, continuous_time, is_drowsy
+        )
+        
+        # 最後の有効フレーム以降に低信頼度フレームがあればリセット状態で終える
+        trailing_from = accepted_idx[-1] + 1 if len(accepted_idx) else 0
+        if low_face[trailing_from:].any():
+            self._reset_state()
+        
+        if len(accepted_idx) > 0:
+            last = accepted_idx[-1]
+            self.last_frame_num = int(frame_nums[last])
+            self._last_valid = (
+                int(is_drowsy[last]),
+                int(frame_nums[last]),
+                bool(left_eye_closed[last]),
+                bool(right_eye_closed[last]),
+                float(continuous_time[last])
+            )
+        
+        self._log_batch_events(frame_nums, invalid_frame, accepted, is_drowsy, last_frame_num)
+        
+        return OutputBatch(
+            is_drowsy=is_drowsy,
+            frame_num=frame_nums,
+            left_eye_closed=left_eye_closed,
+            right_eye_closed=right_eye_closed,
+            continuous_time=continuous_time,
+            error_code=error_code
+        )
+    
+    def _update_batch_sequential(
+        self,
+        frame_nums: np.ndarray,
+        left_eye_open: np.ndarray,
+        right_eye_open: np.ndarray,
+        face_confidence: np.ndarray
+    ) -> OutputBatch:
+        """
+        複数フレームを update と同じ経路で1フレームずつ更新（DEBUG ログ有効時用）
+        
+        Args:
+            frame_nums: フレーム番号配列
+            left_eye_open: 左目の開眼度配列
+            right_eye_open: 右目の開眼度配列
+            face_confidence: 顔検出信頼度配列
+            
+        Returns:
+            判定結果（フィールドごとの配列）
+        """
+        n = len(frame_nums)
+        is_drowsy = np.zeros(n, dtype=np.int8)
+        left_eye_closed = np.zeros(n, dtype=bool)
+        right_eye_closed = np.zeros(n, dtype=bool)
+        continuous_time = np.zeros(n, dtype=np.float64)
+        error_code = np.full(n, None, dtype=object)
+        
+        for i, values in enumerate(zip(
+            frame_nums.tolist(), left_eye_open.tolist(), right_eye_open.tolist(), face_confidence.tolist()
+        )):
+            result = self.update_raw(*values)
+            is_drowsy[i] = result.is_drowsy
+            left_eye_closed[i] = result.left_eye_closed
+            right_eye_closed[i] = result.right_eye_closed
+            continuous_time[i] = result.continuous_time
+            error_code[i] = result.error_code
+        
+        self.logger.debug("Batch of %d frames processed: drowsy=%d",
+                          n, int(np.count_nonzero(is_drowsy == 1)))
+        
+        return OutputBatch(
+            is_drowsy=is_drowsy,
+            frame_num=frame_nums,
+            left_eye_closed=left_eye_closed,
+            right_eye_closed=right_eye_closed,
+            continuous_time=continuous_time,
+            error_code=error_code
+        )
+    
+    def _log_batch_events(
+        self,
+        frame_nums: np.ndarray,
+        invalid_frame: np.ndarray,
+        accepted: np.ndarray,
+        is_drowsy: np.ndarray,
+        last_frame_num: int
+    ) -> None:
+        """
+        逐次処理と同じフレームごとの WARNING・INFO ログをフレーム順に出力
+        
+        Args:
+            frame_nums: フレーム番号配列
+            invalid_frame: 無効なフレーム番号のマスク
+            accepted: 判定を行ったフレームのマスク
+            is_drowsy: 眠気判定結果配列
+            last_frame_num: バッチ処理前の最終フレーム番号
+        """
+        log_invalid = self.logger.is_enabled_for(logging.WARNING) and invalid_frame.any()
+        log_drowsy = self.logger.is_enabled_for(logging.INFO)
+        events = invalid_frame if log_invalid else np.zeros(len(frame_nums), dtype=bool)
+        if log_drowsy:
+            events = events | (is_drowsy == 1)
+        if not events.any():
+            return
+        
+        # 各フレームの処理時点の最終フレーム番号（判定を行ったフレームでのみ更新される）
+        previous = np.maximum.accumulate(
+            np.concatenate(([last_frame_num], np.where(accepted, frame_nums, last_frame_num)[:-1]))
+        )
+        frame_list = frame_nums.tolist()
+        for i in np.flatnonzero(events).tolist():
+            if invalid_frame[i]:
+                self.logger.warning("Invalid frame number: %s <= %s", frame_list[i], int(previous[i]))
+            else:
+                self.logger.info("Drowsiness detected at frame %s", frame_list[i])
+    
+    def _check_frame_order(self, frame_nums: np.ndarray, face_confidence: np.ndarray) -> np.ndarray:
+        """
+        フレーム番号が単調増加していないフレームを判定
+        
+        Args:
+            frame_nums: フレーム番号配列
+            face_confidence: 顔検出信頼度配列
+            
+        Returns:
+            無効なフレーム番号のマスク
+        """
+        n = len(frame_nums)
+        invalid = np.zeros(n, dtype=bool)
+        if n == 0:
+            return invalid
+        # 単調増加であれば全フレーム有効
+        if frame_nums[0] > self.last_frame_num and np.all(np.diff(frame_nums) > 0):
+            return invalid
+        # 最終フレーム番号は有効かつ顔検出成功のフレームでのみ更新される
+        low_face = (face_confidence < self.face_conf_threshold).tolist()
+        last_frame_num = self.last_frame_num
+        for i, frame_num in enumerate(frame_nums.tolist()):
+            if frame_num <= last_frame_num:
+                invalid[i] = True
+            elif not low_face[i]:
+                last_frame_num = frame_num
+        return invalid
+    
+    def _scan_states(
+        self,
+        left_eye: np.ndarray,
+        right_eye: np.ndarray,
+        reset: np.ndarray,
+        out_idx: np.ndarray,
+        left_eye_closed: np.ndarray,
+        right_eye_closed: np.ndarray,
+        continuous_time: np.ndarray,
+        is_drowsy: np.ndarray
+    ) -> None:
+        """
+        目の状態とタイマーをフレーム順に更新し、結果を出力配列へ書き込む
+        
+        Args:
+            left_eye: 前処理済みの左目開眼度配列
+            right_eye: 前処理済みの右目開眼度配列
+            reset: 処理前に状態をリセットするフレームのマスク
+            out_idx: 各フレームの結果を書き込む出力配列上の位置
+            left_eye_closed: 左目閉眼フラグの出力配列
+            right_eye_closed: 右目閉眼フラグの出力配列
+            continuous_time: 連続閉眼時間の出力配列
+            is_drowsy: 眠気判定結果の出力配列
+        """
+        # numba の読み込み（数百 ms）はバッチ処理の初回呼び出しまで遅らせる
+        from drowsy_detection.core._kernels import scan_states
+        
+        left_manager = self.left_eye_manager
+        right_manager = self.right_eye_manager
+        enable_filter = left_manager.enable_filter
+        
+        left_value, right_value, initialized, timer_active, duration = scan_states(
+            np.ascontiguousarray(left_eye, dtype=np.float64),
+            np.ascontiguousarray(right_eye, dtype=np.float64),
+            np.ascontiguousarray(reset, dtype=np.bool_),
+            out_idx,
+            left_eye_closed,
+            right_eye_closed,
+            continuous_time,
+            is_drowsy,
+            enable_filter,
+            float(left_manager.alpha),
+            float(left_manager.close_threshold),
+            float(right_manager.close_threshold),
+            float(self.timer.threshold),
+            self.frame_interval,
+            float(left_manager.filtered_value) if left_manager.is_initialized else 0.0,
+            float(right_manager.filtered_value) if right_manager.is_initialized else 0.0,
+            left_manager.is_initialized,
+            self.timer.state.is_active,
+            float(self.timer.state.current_duration)
+        )
+        
+        # 内部状態を逐次処理と同じ状態に反映
+        if len(left_eye) > 0:
+            if reset.any():
+                self._reset_state()
+            if enable_filter:
+                left_manager.filtered_value = left_value
+                right_manager.filtered_value = right_value
+                left_manager.is_initialized = initialized
+                right_manager.is_initialized = initialized
+            self.timer._restore(timer_active, duration)
+    
+    def _update_eye_states(self, left_eye_open: float, right_eye_open: float) -> Tuple[bool, bool]:
+        """
+        両目の状態（EMA フィルタ・閉眼判定）を更新
+        
+        各 EyeStateManager.update を呼び出した場合と同じ結果・フィルタ状態になります
+        （EyeState の生成を省略）。
+        
+        Args:
+            left_eye_open: 前処理済みの左目開眼度
+            right_eye_open: 前処理済みの右目開眼度
+            
+        Returns:
+            (左目閉眼フラグ, 右目閉眼フラグ)
+        """
+        left_manager = self.left_eye_manager
+        right_manager = self.right_eye_manager
+        if left_manager.enable_filter:
+            left_eye_open = left_manager._apply_ema_filter(left_eye_open)
+            right_eye_open = right_manager._apply_ema_filter(right_eye_open)
+        return left_eye_open <= left_manager.close_threshold, right_eye_open <= right_manager.close_threshold
     
     def _evaluate_drowsy_state(
         self,
         frame_num: int,
-        left_eye_state: EyeState,
-        right_eye_state: EyeState
-    ) -> OutputData:
+        left_eye_closed: bool,
+        right_eye_closed: bool
+    ) -> Tuple[int, float]:
         """
         眠気状態を評価
         
         Args:
             frame_num: フレーム番号
-            left_eye_state: 左目の状態
-            right_eye_state: 右目の状態
+            left_eye_closed: 左目閉眼フラグ
+            right_eye_closed: 右目閉眼フラグ
             
         Returns:
-            判定結果
+            (眠気判定結果, 連続閉眼時間 [s])
         """
         # 両目が閉眼状態かチェック
-        both_eyes_closed = left_eye_state.is_closed and right_eye_state.is_closed
+        both_eyes_closed = left_eye_closed and right_eye_closed
         
         if both_eyes_closed:
             # タイマー開始または更新
             if not self.timer.state.is_active:
                 self.timer.start()
-                self.logger.debug("Timer started - both eyes closed")
+                if self.logger.debug_enabled:
+                    self.logger.debug("Timer started - both eyes closed")
             
-            # フレーム間隔を計算（フレームレートベース）
-            dt = 1.0 / self.frame_rate
-            self.timer.update(dt)
+            # フレーム間隔（フレームレート設定時に計算済み）分だけ更新
+            self.timer.update(self.frame_interval)
             
             # 閾値チェック
             if self.timer.is_threshold_exceeded():
                 is_drowsy = 1
-                self.logger.info(f"Drowsiness detected at frame {frame_num}")
+                self.logger.info("Drowsiness detected at frame %s", frame_num)
             else:
                 is_drowsy = 0
         else:
             # タイマーリセット
-            if self.timer.state.is_active:
+            if self.timer.state.is_active and self.logger.debug_enabled:
                 self.logger.debug("Timer stopped - eyes opened")
             self.timer.stop()
             is_drowsy = 0
         
-        return OutputData(
-            is_drowsy=is_drowsy,
-            frame_num=frame_num,
-            left_eye_closed=left_eye_state.is_closed,
-            right_eye_closed=right_eye_state.is_closed,
-            continuous_time=self.timer.get_current_duration(),
-            error_code=None
-        )
+        return is_drowsy, float(self.timer.get_current_duration())
     
     def _reset_state(self) -> None:
         """状態リセット"""
         self.timer.stop()
         self.left_eye_manager.reset()
         self.right_eye_manager.reset()
-        self.logger.debug("State reset")
-    
-    def _create_error_output(self, frame_num: int, error_code: str) -> OutputData:
-        """
-        エラー出力を作成
-        
-        Args:
-            frame_num: フレーム番号
-            error_code: エラーコード
-            
-        Returns:
-            エラー結果
-        """
-        return OutputData(
-            is_drowsy=-1,
-            frame_num=frame_num,
-            left_eye_closed=False,
-            right_eye_closed=False,
-            continuous_time=0.0,
-            error_code=error_code
-        )
+        if self.logger.debug_enabled:
+            self.logger.debug("State reset")
     
     def reset(self) -> None:
         """完全リセット"""
         self._reset_state()
         self.last_frame_num = -1
-        self.last_valid_result = None
+        self._last_valid = None
         self.data_processor.reset()
         self.logger.info("DrowsyDetector reset")
     
+    @property
+    def last_valid_result(self) -> Optional[OutputData]:
+        """最後に受理されたフレームの判定結果（未処理時は None）"""
+        if self._last_valid is None:
+            return None
+        is_drowsy, frame_num, left_eye_closed, right_eye_closed, continuous_time = self._last_valid
+        return OutputData(
+            is_drowsy=is_drowsy,
+            frame_num=frame_num,
+            left_eye_closed=left_eye_closed,
+            right_eye_closed=right_eye_closed,
+            continuous_time=continuous_time
+        )
+    
+    @property
+    def frame_rate(self) -> float:
+        """フレームレート [fps]"""
+        return self._frame_rate
+    
+    @frame_rate.setter
+    def frame_rate(self, fps: float) -> None:
+        self._frame_rate = fps
+        # フレームごとの割り算を避けるため、フレーム間隔 [s] も併せて保持
+        self.frame_interval = 1.0 / fps
+    
     def set_frame_rate(self, fps: float) -> None:
         """
         フレームレートを設定
@@ -206,7 +577,7 @@ class DrowsyDetector:
             raise ValueError("Frame rate must be positive")
         
         self.frame_rate = fps
-        self.logger.info(f"Frame rate set to {fps} fps")
+        self.logger.info("Frame rate set to %s fps", fps)
     
     def get_statistics(self) -> dict:
         """統計情報を取得"""
@@ -9,7 +9,7 @@ from typing import Tuple
 import numpy as np
 
 
-@dataclass
+@dataclass(slots=True)
 class EyeState:
     """目の状態データクラス"""
     is_closed: bool
@@ -22,11 +22,32 @@ class EyeState:
             raise ValueError("open_ratio must be between 0.0 and 1.0")
         if not (0.0 <= self.filtered_open_ratio <= 1.0):
             raise ValueError("filtered_open_ratio must be between 0.0 and 1.0")
+    
+    @classmethod
+    def construct(cls, is_closed: bool, open_ratio: float, filtered_open_ratio: float) -> "EyeState":
+        """
+        検証を省略して生成（0.0〜1.0 に制限済みの値専用）
+        
+        Args:
+            is_closed: 閉眼フラグ
+            open_ratio: 開眼度
+            filtered_open_ratio: フィルタ済み開眼度
+            
+        Returns:
+            目の状態
+        """
+        state = cls.__new__(cls)
+        state.is_closed = is_closed
+        state.open_ratio = open_ratio
+        state.filtered_open_ratio = filtered_open_ratio
+        return state
 
 
 class EyeStateManager:
     """目の状態管理クラス"""
     
+    __slots__ = ('close_threshold', 'enable_filter', 'alpha', 'filtered_value', 'is_initialized')
+    
     def __init__(self, close_threshold: float, enable_filter: bool = True, alpha: float = 0.3):
         """
         目の状態管理クラスを初期化
@@ -57,8 +78,12 @@ class EyeStateManager:
         Returns:
             更新された目の状態
         """
-        # 入力値の正規化
-        normalized_ratio = np.clip(open_ratio, 0.0, 1.0)
+        # NaN は制限できないため、ここで検証（EyeState 側の検証は省略）
+        if open_ratio != open_ratio:
+            raise ValueError("open_ratio cannot be NaN")
+        
+        # 入力値の正規化（NumPy スカラーが渡されても以降は Python の float で演算）
+        normalized_ratio = 0.0 if open_ratio < 0.0 else (1.0 if open_ratio > 1.0 else float(open_ratio))
         
         # フィルタ適用
         if self.enable_filter:
@@ -69,11 +94,40 @@ class EyeStateManager:
         # 閉眼判定
         is_closed = filtered_ratio <= self.close_threshold
         
-        return EyeState(
-            is_closed=is_closed,
-            open_ratio=normalized_ratio,
-            filtered_open_ratio=filtered_ratio
-        )
+        # 値は制限済み（EMA も 0.0〜1.0 の凸結合）のため検証を省略
+        return EyeState.construct(is_closed, normalized_ratio, filtered_ratio)
+    
+    def update_batch(self, open_ratio: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        目の状態をまとめて更新
+        
+        update をフレーム順に呼び出した場合と同じ結果・フィルタ状態になります。
+        
+        Args:
+            open_ratio: 開眼度配列
+            
+        Returns:
+            (閉眼フラグ, フィルタ済み開眼度) の配列
+        """
+        normalized_ratio = np.clip(np.asarray(open_ratio, dtype=np.float64), 0.0, 1.0)
+        
+        if self.enable_filter:
+            # numba の読み込みは初回呼び出しまで遅らせる
+            from drowsy_detection.core._kernels import ema_filter
+            
+            filtered_ratio, is_initialized, filtered_value = ema_filter(
+                normalized_ratio,
+                float(self.alpha),
+                self.is_initialized,
+                float(self.filtered_value) if self.is_initialized else 0.0
+            )
+            if len(filtered_ratio) > 0:
+                self.is_initialized = is_initialized
+                self.filtered_value = filtered_value
+        else:
+            filtered_ratio = normalized_ratio
+        
+        return filtered_ratio <= self.close_threshold, filtered_ratio
     
     def _apply_ema_filter(self, value: float) -> float:
         """
@@ -5,15 +5,16 @@
 """
 
 import time
-from typing import Optional
+from typing import Optional, Tuple
 from dataclasses import dataclass
+import numpy as np
 
 
-@dataclass
+@dataclass(slots=True)
 class TimerState:
     """タイマー状態データクラス"""
     is_active: bool = False
-    start_time: Optional[float] = None
+    start_time: Optional[float] = None  # time.monotonic() 基準 [s]
     current_duration: float = 0.0
     last_update_time: Optional[float] = None
 
@@ -21,6 +22,8 @@ class TimerState:
 class ContinuousTimer:
     """連続時間計測タイマークラス"""
     
+    __slots__ = ('threshold', 'state')
+    
     def __init__(self, threshold: float):
         """
         連続時間計測タイマーを初期化
@@ -35,8 +38,8 @@ class ContinuousTimer:
         self.state = TimerState()
     
     def start(self) -> None:
-        """タイマー開始"""
-        current_time = time.time()
+        """タイマー開始（時刻は時計補正の影響を受けない単調時計で記録）"""
+        current_time = time.monotonic()
         self.state.is_active = True
         self.state.start_time = current_time
         self.state.last_update_time = current_time
@@ -68,6 +71,46 @@ class ContinuousTimer:
         self.state.current_duration += dt
         return self.state.current_duration
     
+    def update_batch(self, closed: np.ndarray, dt: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        閉眼フラグ列に沿ってタイマーをまとめて更新
+        
+        閉眼中のフレームで開始（未動作時）と update(dt) を、
+        それ以外のフレームで stop() を順に呼び出した場合と同じ結果になります。
+        
+        Args:
+            closed: 両目閉眼フラグ配列
+            dt: フレーム間隔 [s]
+            
+        Returns:
+            (各フレームの継続時間 [s], 閾値超過フラグ) の配列
+        """
+        if dt < 0:
+            raise ValueError("dt must be non-negative")
+        
+        # numba の読み込みは初回呼び出しまで遅らせる
+        from drowsy_detection.core._kernels import scan_timer
+        
+        durations, exceeded, is_active, duration = scan_timer(
+            np.ascontiguousarray(closed, dtype=np.bool_),
+            float(self.threshold),
+            float(dt),
+            self.state.is_active,
+            float(self.state.current_duration)
+        )
+        if len(durations) > 0:
+            self._restore(is_active, duration)
+        return durations, exceeded
+    
+    def _restore(self, is_active: bool, duration: float) -> None:
+        """一括処理後の状態を反映（新たに動作した場合は開始時刻を記録）"""
+        if is_active:
+            if not self.state.is_active:
+                self.start()
+            self.state.current_duration = duration
+        else:
+            self.stop()
+    
     def is_threshold_exceeded(self) -> bool:
         """閾値を超えているかチェック"""
         return self.state.current_duration >= self.threshold
@@ -4,46 +4,117 @@
 入力データの前処理、NaN値の処理、範囲制限などを提供します。
 """
 
+import math
 import numpy as np
-from typing import Optional
+from typing import Optional, Tuple
 from drowsy_detection.config.validators import InputData, ProcessedData
 
 
+def _clamp01(value: float) -> float:
+    """値を 0.0〜1.0 に制限（スカラー用）"""
+    return 0.0 if value < 0.0 else (1.0 if value > 1.0 else value)
+
+
 class DataProcessor:
     """データ前処理クラス"""
     
+    __slots__ = ('last_valid_data', 'nan_count', 'total_count')
+    
     def __init__(self):
         self.last_valid_data: Optional[ProcessedData] = None
         self.nan_count = 0
         self.total_count = 0
     
     def preprocess(self, input_data: InputData) -> ProcessedData:
+        return self.preprocess_values(
+            input_data.left_eye_open,
+            input_data.right_eye_open,
+            input_data.face_confidence
+        )
+    
+    def preprocess_values(self, left_eye: float, right_eye: float, face_conf: float) -> ProcessedData:
+        """
+        1フレーム分の値を前処理
+        
+        Args:
+            left_eye: 左目の開眼度
+            right_eye: 右目の開眼度
+            face_conf: 顔検出信頼度
+            
+        Returns:
+            前処理済みデータ
+        """
         self.total_count += 1
-        left_eye = self._handle_nan_value(input_data.left_eye_open, "left_eye_open")
-        right_eye = self._handle_nan_value(input_data.right_eye_open, "right_eye_open")
-        face_conf = self._handle_nan_value(input_data.face_confidence, "face_confidence")
-        left_eye = np.clip(left_eye, 0.0, 1.0)
-        right_eye = np.clip(right_eye, 0.0, 1.0)
-        face_conf = np.clip(face_conf, 0.0, 1.0)
-        self.last_valid_data = ProcessedData(
+        # NaN は直前の有効値（なければ 0.0）で補完
+        if math.isnan(left_eye):
+            self.nan_count += 1
+            left_eye = self.last_valid_data.left_eye_open if self.last_valid_data is not None else 0.0
+        if math.isnan(right_eye):
+            self.nan_count += 1
+            right_eye = self.last_valid_data.right_eye_open if self.last_valid_data is not None else 0.0
+        if math.isnan(face_conf):
+            self.nan_count += 1
+            face_conf = self.last_valid_data.face_confidence if self.last_valid_data is not None else 0.0
+        left_eye = _clamp01(left_eye)
+        right_eye = _clamp01(right_eye)
+        face_conf = _clamp01(face_conf)
+        # 値は制限済みのため検証を省略
+        self.last_valid_data = ProcessedData.construct(
             left_eye_open=left_eye,
             right_eye_open=right_eye,
             face_confidence=face_conf
         )
         return self.last_valid_data
     
-    def _handle_nan_value(self, value: float, field_name: str) -> float:
-        if np.isnan(value):
-            self.nan_count += 1
-            if self.last_valid_data is not None:
-                if field_name == "left_eye_open":
-                    return self.last_valid_data.left_eye_open
-                elif field_name == "right_eye_open":
-                    return self.last_valid_data.right_eye_open
-                elif field_name == "face_confidence":
-                    return self.last_valid_data.face_confidence
-            return 0.0
-        return value
+    def preprocess_batch(
+        self,
+        left_eye_open: np.ndarray,
+        right_eye_open: np.ndarray,
+        face_confidence: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        複数フレームをまとめて前処理
+        
+        preprocess をフレーム順に呼び出した場合と同じ結果を返します。
+        NaN は直前の有効値で補完し、値は 0.0〜1.0 に制限します。
+        
+        Args:
+            left_eye_open: 左目の開眼度配列
+            right_eye_open: 右目の開眼度配列
+            face_confidence: 顔検出信頼度配列
+            
+        Returns:
+            前処理済みの (左目開眼度, 右目開眼度, 顔検出信頼度) 配列
+        """
+        last = self.last_valid_data
+        left_eye = self._fill_nan_batch(left_eye_open, last.left_eye_open if last else 0.0)
+        right_eye = self._fill_nan_batch(right_eye_open, last.right_eye_open if last else 0.0)
+        face_conf = self._fill_nan_batch(face_confidence, last.face_confidence if last else 0.0)
+        np.clip(left_eye, 0.0, 1.0, out=left_eye)
+        np.clip(right_eye, 0.0, 1.0, out=right_eye)
+        np.clip(face_conf, 0.0, 1.0, out=face_conf)
+        n = len(left_eye)
+        self.total_count += n
+        if n > 0:
+            self.last_valid_data = ProcessedData.construct(
+                left_eye_open=float(left_eye[-1]),
+                right_eye_open=float(right_eye[-1]),
+                face_confidence=float(face_conf[-1])
+            )
+        return left_eye, right_eye, face_conf
+    
+    def _fill_nan_batch(self, values: np.ndarray, seed: float) -> np.ndarray:
+        """NaN を直前の有効値（先頭は seed）で前方補完した配列を返す"""
+        values = np.array(values, dtype=np.float64)
+        nan_mask = np.isnan(values)
+        nan_count = int(np.count_nonzero(nan_mask))
+        if nan_count == 0:
+            return values
+        self.nan_count += nan_count
+        # 各位置の直前の有効値インデックス（有効値がなければ -1）
+        last_valid_idx = np.where(nan_mask, -1, np.arange(len(values)))
+        np.maximum.accumulate(last_valid_idx, out=last_valid_idx)
+        return np.where(last_valid_idx >= 0, values[last_valid_idx], seed)
     
     def reset(self) -> None:
         self.last_valid_data = None
@@ -63,4 +134,31 @@ class DataProcessor:
         if not values:
             return 0.0
         recent_values = values[-window_size:]
-        return float(np.mean(recent_values))
+        return sum(recent_values) / len(recent_values)
+    
+    def apply_smoothing_batch(self, values: np.ndarray, window_size: int = 3) -> np.ndarray:
+        """
+        系列の各時点について直近 window_size 個の平均値をまとめて計算
+        
+        先頭から i 番目までを apply_smoothing に渡した場合と同じ値（丸め誤差を除く）を返します。
+        
+        Args:
+            values: 値の系列
+            window_size: 移動窓の大きさ（1 以上）
+            
+        Returns:
+            各時点の移動平均値の配列
+            
+        Raises:
+            ValueError: window_size が 1 未満の場合
+        """
+        if window_size < 1:
+            raise ValueError(f"window_size must be >= 1, got {window_size}")
+        values = np.asarray(values, dtype=np.float64)
+        n = len(values)
+        if n == 0:
+            return values
+        # 窓ごとの合計（累積和の差と違い、系列が長くても誤差が蓄積しない）
+        window_sums = np.convolve(values, np.ones(window_size))[:n]
+        counts = np.minimum(np.arange(1, n + 1), window_size)
+        return window_sums / counts
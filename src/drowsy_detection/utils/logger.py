@@ -6,7 +6,16 @@
 
 import logging
 import sys
-from typing import Optional
+from typing import Any, Optional
+
+
+# ハンドラー間で共有するフォーマッター
+_CONSOLE_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+_DETAIL_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
+)
 
 
 class Logger:
@@ -28,51 +37,58 @@ class Logger:
         
         # コンソールハンドラー設定
         console_handler = logging.StreamHandler(sys.stdout)
-        console_formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        console_handler.setFormatter(console_formatter)
+        console_handler.setFormatter(_CONSOLE_FORMATTER)
         self.logger.addHandler(console_handler)
         
-        # ファイルハンドラー設定（指定がある場合）
+        # ファイルハンドラー設定（指定がある場合、ファイルは最初の出力時に開く）
         if log_file:
-            file_handler = logging.FileHandler(log_file)
-            file_formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
-            )
-            file_handler.setFormatter(file_formatter)
+            file_handler = logging.FileHandler(log_file, delay=True)
+            file_handler.setFormatter(_DETAIL_FORMATTER)
             self.logger.addHandler(file_handler)
         
-        # デバッグログ設定
+        # デバッグログ設定（ファイルは最初の出力時に開く）
         if enable_debug:
-            debug_handler = logging.FileHandler("drowsy_detection_debug.log")
+            debug_handler = logging.FileHandler("drowsy_detection_debug.log", delay=True)
             debug_handler.setLevel(logging.DEBUG)
-            debug_formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
-            )
-            debug_handler.setFormatter(debug_formatter)
+            debug_handler.setFormatter(_DETAIL_FORMATTER)
             self.logger.addHandler(debug_handler)
         
         # ログの重複を防ぐ
         self.logger.propagate = False
     
-    def info(self, message: str) -> None:
-        self.logger.info(message)
+    # メッセージは logging と同様に %-形式の引数で渡すと、
+    # 出力されないレベルでは文字列整形が行われない
+    def info(self, message: str, *args: Any) -> None:
+        self.logger.info(message, *args, stacklevel=2)
+    
+    def warning(self, message: str, *args: Any) -> None:
+        self.logger.warning(message, *args, stacklevel=2)
+    
+    def error(self, message: str, *args: Any) -> None:
+        self.logger.error(message, *args, stacklevel=2)
     
-    def warning(self, message: str) -> None:
-        self.logger.warning(message)
+    def debug(self, message: str, *args: Any) -> None:
+        self.logger.debug(message, *args, stacklevel=2)
     
-    def error(self, message: str) -> None:
-        self.logger.error(message)
+    def critical(self, message: str, *args: Any) -> None:
+        self.logger.critical(message, *args, stacklevel=2)
     
-    def debug(self, message: str) -> None:
-        self.logger.debug(message)
+    @property
+    def debug_enabled(self) -> bool:
+        """
+        DEBUG ログの出力有無（フレームごとのメッセージ生成を省略する判定用）
+        
+        ロガーは全インスタンスで共有されるため、値を保持せず毎回判定します
+        （判定結果は logging 側でキャッシュされます）。
+        """
+        return self.logger.isEnabledFor(logging.DEBUG)
     
-    def critical(self, message: str) -> None:
-        self.logger.critical(message)
+    def is_enabled_for(self, level: int) -> bool:
+        """指定レベルのログが出力対象かを判定"""
+        return self.logger.isEnabledFor(level)
     
     def set_level(self, level: str) -> None:
         self.logger.setLevel(getattr(logging, level.upper()))
     
     def log_performance(self, func_name: str, duration: float) -> None:
-        self.debug(f"Performance: {func_name} took {duration:.4f} seconds")
+        self.logger.debug("Performance: %s took %.4f seconds", func_name, duration, stacklevel=2)
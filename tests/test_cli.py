@@ -0,0 +1,92 @@
+"""
+CLI モジュールのテスト
+"""
+
+import json
+import numpy as np
+import pytest
+from drowsy_detection.cli import main as cli
+from drowsy_detection.config.config import Config
+from drowsy_detection.core.drowsy_detector import DrowsyDetector
+
+
+def run_cli(monkeypatch, *args):
+    """引数を指定して CLI を実行"""
+    monkeypatch.setattr("sys.argv", ["drowsy-detect", *args])
+    cli.main()
+
+
+class TestInputFile:
+    """入力ファイル読み込みのテスト"""
+    
+    @pytest.mark.parametrize("use_ijson", [True, False])
+    @pytest.mark.parametrize("content", [
+        {"frame_num": 1, "left_eye_open": 0.8, "right_eye_open": 0.8, "face_confidence": 0.95},
+        {},
+        5,
+    ])
+    def test_non_array_input(self, tmp_path, monkeypatch, capsys, content, use_ijson):
+        """最上位が JSON 配列でない入力のテスト"""
+        if not use_ijson:
+            monkeypatch.setattr(cli, "ijson", None)
+        input_path = tmp_path / "input.json"
+        input_path.write_text(json.dumps(content), encoding="utf-8")
+        output_path = tmp_path / "result.json"
+        
+        with pytest.raises(SystemExit) as exc_info:
+            run_cli(monkeypatch, "--input", str(input_path), "--output", str(output_path))
+        
+        assert exc_info.value.code == 1
+        assert cli.NOT_ARRAY_ERROR in capsys.readouterr().out
+        assert not output_path.exists()
+    
+    def test_array_input(self, tmp_path, monkeypatch, capsys):
+        """JSON 配列の入力のテスト"""
+        input_path = tmp_path / "input.json"
+        input_path.write_text(json.dumps([
+            {"frame_num": i + 1, "left_eye_open": 0.8, "right_eye_open": 0.8, "face_confidence": 0.95}
+            for i in range(3)
+        ]), encoding="utf-8")
+        output_path = tmp_path / "result.json"
+        
+        run_cli(monkeypatch, "--input", str(input_path), "--output", str(output_path))
+        
+        results = json.loads(output_path.read_text(encoding="utf-8"))
+        assert [r["frame_num"] for r in results] == [1, 2, 3]
+        
+        out = capsys.readouterr().out
+        assert out.index(f"Loaded 3 frames from {input_path}") < out.index("Processed 3/3 frames")
+
+
+class TestSplitSessions:
+    """--split-sessions のテスト"""
+    
+    @pytest.mark.parametrize("jobs", ["1", "2"])
+    def test_split_sessions(self, tmp_path, monkeypatch, capsys, jobs):
+        """セッションごとの独立処理と初期化ログ・デバッグログファイルのテスト"""
+        monkeypatch.chdir(tmp_path)
+        eye_values = np.array([0.8] * 20 + [0.05] * 40)
+        session = [
+            {"frame_num": i + 1, "left_eye_open": v, "right_eye_open": v, "face_confidence": 0.95}
+            for i, v in enumerate(eye_values.tolist())
+        ]
+        input_path = tmp_path / "input.json"
+        input_path.write_text(json.dumps(session * 3), encoding="utf-8")
+        output_path = tmp_path / "result.json"
+        
+        run_cli(monkeypatch, "--input", str(input_path), "--output", str(output_path),
+                "--split-sessions", "--jobs", jobs, "--verbose")
+        
+        # 各セッションは新しい検出器で処理した場合と同じ結果になる
+        frame_nums = np.arange(1, len(eye_values) + 1)
+        face = np.full(len(eye_values), 0.95)
+        detector = DrowsyDetector(Config(log_level="ERROR"))
+        expected = detector.update_batch(frame_nums, eye_values, eye_values, face).to_dicts()
+        results = json.loads(output_path.read_text(encoding="utf-8"))
+        assert results == expected * 3
+        assert any(r["is_drowsy"] == 1 for r in expected)
+        
+        # 初期化ログとデバッグログファイルはメインプロセスの検出器のみ（並列実行時はなし）
+        out = capsys.readouterr().out
+        assert out.count("DrowsyDetector initialized with config") == (1 if jobs == "1" else 0)
+        assert (tmp_path / "drowsy_detection_debug.log").exists() == (jobs == "1")
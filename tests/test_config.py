@@ -3,8 +3,10 @@
 """
 
 import pytest
+import numpy as np
 from drowsy_detection.config.config import Config, ConfigValidator
 from drowsy_detection.config.validators import InputData, OutputData
+from drowsy_detection.cli.main import SAMPLE_CONFIG
 
 
 class TestConfig:
@@ -75,6 +77,11 @@ class TestConfig:
         
         config = Config(log_level="info")
         assert config.log_level == "INFO"
+    
+    def test_sample_config_matches_defaults(self):
+        """サンプル設定とデフォルト設定の一致のテスト"""
+        assert SAMPLE_CONFIG == Config().dict()
+        assert list(SAMPLE_CONFIG) == list(Config().dict())
 
 
 class TestConfigValidator:
@@ -160,6 +167,22 @@ class TestInputData:
                 right_eye_open=0.9,
                 face_confidence=1.1
             )
+    
+    def test_validate_batch(self):
+        """配列の一括検証のテスト"""
+        frame_nums = np.array([1, 2, 3])
+        values = np.array([[0.0, 0.5, 1.0], [0.8, 0.9, 0.95], [0.1, 0.2, 0.3]])
+        assert InputData.validate_batch(frame_nums, values) == True
+        
+        assert InputData.validate_batch(np.array([1, -1, 3]), values) == False
+        
+        out_of_range = values.copy()
+        out_of_range[1, 0] = 1.1
+        assert InputData.validate_batch(frame_nums, out_of_range) == False
+        
+        with_nan = values.copy()
+        with_nan[2, 2] = np.nan
+        assert InputData.validate_batch(frame_nums, with_nan) == False
 
 
 class TestOutputData:
@@ -196,6 +219,19 @@ class TestOutputData:
         assert data.is_drowsy == -1
         assert data.error_code == "LOW_FACE_CONFIDENCE"
     
+    def test_to_dict(self):
+        """辞書変換のテスト"""
+        data = OutputData(
+            is_drowsy=1,
+            frame_num=10,
+            left_eye_closed=True,
+            right_eye_closed=False,
+            continuous_time=1.5
+        )
+        
+        assert data.to_dict() == data.dict()
+        assert list(data.to_dict()) == list(data.dict())
+    
     def test_invalid_is_drowsy(self):
         """無効な眠気判定値のテスト"""
         with pytest.raises(ValueError):
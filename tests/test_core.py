@@ -3,8 +3,10 @@
 """
 
 import pytest
+import numpy as np
 from drowsy_detection.core.timer import ContinuousTimer, TimerState
 from drowsy_detection.core.eye_state import EyeStateManager, EyeState
+from drowsy_detection.utils.data_processor import DataProcessor
 
 
 class TestContinuousTimer:
@@ -107,6 +109,33 @@ class TestContinuousTimer:
         timer.reset()
         assert timer.state.is_active == False
         assert timer.state.current_duration == 0.0
+    
+    def test_update_batch_matches_update(self):
+        """一括更新と逐次更新の一致テスト"""
+        closed = np.array([True, True, False, True, True, True, True])
+        dt = 0.25
+        
+        sequential = ContinuousTimer(0.75)
+        expected_durations = []
+        expected_exceeded = []
+        for is_closed in closed:
+            if is_closed:
+                if not sequential.state.is_active:
+                    sequential.start()
+                sequential.update(dt)
+            else:
+                sequential.stop()
+            expected_durations.append(sequential.get_current_duration())
+            expected_exceeded.append(sequential.is_threshold_exceeded())
+        
+        timer = ContinuousTimer(0.75)
+        durations_a, exceeded_a = timer.update_batch(closed[:4], dt)
+        durations_b, exceeded_b = timer.update_batch(closed[4:], dt)
+        
+        assert np.concatenate([durations_a, durations_b]).tolist() == expected_durations
+        assert np.concatenate([exceeded_a, exceeded_b]).tolist() == expected_exceeded
+        assert timer.state.is_active == sequential.state.is_active
+        assert timer.get_current_duration() == sequential.get_current_duration()
 
 
 class TestEyeStateManager:
@@ -171,6 +200,24 @@ class TestEyeStateManager:
         expected = 0.5 * 0.4 + 0.5 * 0.8  # alpha * new + (1-alpha) * old
         assert abs(state.filtered_open_ratio - expected) < 1e-6
     
+    def test_update_batch_matches_update(self):
+        """一括更新と逐次更新の一致テスト"""
+        values = np.array([0.8, 0.4, -0.2, 0.1, 1.3, 0.25, 0.3])
+        
+        for enable_filter in (True, False):
+            sequential = EyeStateManager(close_threshold=0.3, enable_filter=enable_filter, alpha=0.4)
+            states = [sequential.update(v) for v in values]
+            
+            manager = EyeStateManager(close_threshold=0.3, enable_filter=enable_filter, alpha=0.4)
+            closed_a, filtered_a = manager.update_batch(values[:3])
+            closed_b, filtered_b = manager.update_batch(values[3:])
+            
+            assert np.concatenate([closed_a, closed_b]).tolist() == [s.is_closed for s in states]
+            assert np.concatenate([filtered_a, filtered_b]).tolist() == [
+                s.filtered_open_ratio for s in states
+            ]
+            assert manager.get_filter_state() == sequential.get_filter_state()
+    
     def test_value_clipping(self):
         """値の範囲制限のテスト"""
         manager = EyeStateManager(close_threshold=0.3)
@@ -227,6 +274,18 @@ class TestEyeState:
         assert state.open_ratio == 0.2
         assert state.filtered_open_ratio == 0.25
     
+    def test_construct_matches_validated(self):
+        """検証省略生成のテスト"""
+        state = EyeState.construct(True, 0.2, 0.25)
+        assert state == EyeState(is_closed=True, open_ratio=0.2, filtered_open_ratio=0.25)
+    
+    def test_manager_rejects_nan(self):
+        """NaN 入力のテスト"""
+        manager = EyeStateManager(close_threshold=0.3)
+        with pytest.raises(ValueError):
+            manager.update(float('nan'))
+        assert manager.is_initialized == False
+    
     def test_invalid_open_ratio(self):
         """無効な開眼度のテスト"""
         with pytest.raises(ValueError):
@@ -258,3 +317,31 @@ class TestEyeState:
                 open_ratio=0.5,
                 filtered_open_ratio=1.1
             )
+
+
+class TestDataProcessor:
+    """DataProcessor の平滑化のテスト"""
+    
+    @pytest.mark.parametrize("window_size", [1, 3, 7, 50])
+    def test_apply_smoothing_batch_matches_apply_smoothing(self, window_size):
+        """系列一括の移動平均と逐次計算の一致テスト"""
+        processor = DataProcessor()
+        values = np.random.default_rng(0).random(40)
+        
+        batch = processor.apply_smoothing_batch(values, window_size)
+        expected = [
+            processor.apply_smoothing(list(values[:i + 1]), window_size)
+            for i in range(len(values))
+        ]
+        
+        np.testing.assert_allclose(batch, expected, rtol=1e-12)
+    
+    def test_apply_smoothing_batch_empty(self):
+        """空系列のテスト"""
+        assert len(DataProcessor().apply_smoothing_batch(np.array([]))) == 0
+    
+    @pytest.mark.parametrize("window_size", [0, -1])
+    def test_apply_smoothing_batch_invalid_window(self, window_size):
+        """無効な窓サイズのテスト"""
+        with pytest.raises(ValueError):
+            DataProcessor().apply_smoothing_batch(np.array([0.5, 0.6]), window_size)
@@ -2,27 +2,30 @@
 DrowsyDetector メインクラスのテスト
 """
 
+import logging
 import pytest
 import numpy as np
 from drowsy_detection.config.config import Config
 from drowsy_detection.config.validators import InputData
 from drowsy_detection.core.drowsy_detector import DrowsyDetector
+from drowsy_detection.core.eye_state import EyeStateManager
+
+
+@pytest.fixture(scope="module")
+def config():
+    """テスト用設定（変更されないためモジュール内で共有）"""
+    return Config(
+        left_eye_close_threshold=0.30,
+        right_eye_close_threshold=0.30,
+        continuous_close_time=1.0,
+        face_conf_threshold=0.70,
+        log_level="ERROR"  # テスト中はエラーのみ表示
+    )
 
 
 class TestDrowsyDetector:
     """DrowsyDetector 単体テスト"""
     
-    @pytest.fixture
-    def config(self):
-        """テスト用設定"""
-        return Config(
-            left_eye_close_threshold=0.30,
-            right_eye_close_threshold=0.30,
-            continuous_close_time=1.0,
-            face_conf_threshold=0.70,
-            log_level="ERROR"  # テスト中はエラーのみ表示
-        )
-    
     @pytest.fixture
     def detector(self, config):
         """テスト用検出器"""
@@ -102,6 +105,19 @@ class TestDrowsyDetector:
                 assert result.continuous_time == 0.0
                 assert result.is_drowsy == 0
     
+    def test_intermittent_closure_batch(self, detector):
+        """断続的閉眼テスト（バッチ更新）"""
+        # 閉眼 (10フレーム) → 開眼 (10フレーム) を3回繰り返す（連続閉眼にならない）
+        eye_values = np.tile(np.repeat([0.1, 0.8], 10), 3)
+        result = detector.update_batch(
+            np.arange(1, len(eye_values) + 1), eye_values, eye_values, np.full(len(eye_values), 0.95)
+        )
+        
+        # 開眼時はタイマーがリセットされる
+        is_open = eye_values == 0.8
+        assert np.all(result.continuous_time[is_open] == 0.0)
+        assert np.all(result.is_drowsy[is_open] == 0)
+    
     def test_low_face_confidence(self, detector):
         """低信頼度テスト"""
         input_data = InputData(
@@ -184,6 +200,7 @@ class TestDrowsyDetector:
         # 新しい値を設定
         detector.set_frame_rate(60.0)
         assert detector.frame_rate == 60.0
+        assert detector.frame_interval == 1.0 / 60.0
         
         # 無効な値
         with pytest.raises(ValueError):
@@ -237,21 +254,20 @@ class TestDrowsyDetector:
         assert result.is_drowsy == 0  # まだ時間不足
         assert result.error_code is None
     
+    @pytest.mark.slow
     def test_long_session(self, detector):
         """長時間セッションのテスト"""
         drowsy_count = 0
         
-        # 長時間の処理をシミュレート
-        for i in range(1, 301):  # 300フレーム = 10秒
-            if i % 100 < 50:  # 半分の時間は閉眼
-                left_eye, right_eye = 0.1, 0.1
-            else:
-                left_eye, right_eye = 0.8, 0.8
-            
+        # 長時間の処理をシミュレート（300フレーム = 10秒、半分の時間は閉眼）
+        frame_nums = np.arange(1, 301)
+        eye_values = np.where(frame_nums % 100 < 50, 0.1, 0.8)
+        
+        for i, eye_value in zip(frame_nums.tolist(), eye_values.tolist()):
             input_data = InputData(
                 frame_num=i,
-                left_eye_open=left_eye,
-                right_eye_open=right_eye,
+                left_eye_open=eye_value,
+                right_eye_open=eye_value,
                 face_confidence=0.95
             )
             
@@ -265,3 +281,136 @@ class TestDrowsyDetector:
         # 統計情報で処理された件数を確認
         stats = detector.get_statistics()
         assert stats['data_processor']['total_processed'] == 300
+    
+    def test_update_batch_matches_update(self, config):
+        """バッチ更新が逐次更新と同じ結果になることのテスト"""
+        frame_nums = np.array([1, 2, 3, 3, 4, 5, 6, 7, 8, 9] + list(range(10, 60)))
+        left = np.array([0.8, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1] + [0.1] * 50)
+        right = left.copy()
+        face = np.array([0.95] * 5 + [0.5] + [0.95] * 54)
+        
+        sequential = DrowsyDetector(config)
+        expected = [
+            sequential.update(InputData(
+                frame_num=int(f), left_eye_open=l, right_eye_open=r, face_confidence=c
+            )).to_dict()
+            for f, l, r, c in zip(frame_nums, left, right, face)
+        ]
+        
+        batched = DrowsyDetector(config)
+        first = batched.update_batch(frame_nums[:20], left[:20], right[:20], face[:20])
+        second = batched.update_batch(frame_nums[20:], left[20:], right[20:], face[20:])
+        
+        assert first.to_dicts() + second.to_dicts() == expected
+        assert batched.get_statistics() == sequential.get_statistics()
+        assert batched.last_valid_result == sequential.last_valid_result
+    
+    @pytest.mark.parametrize("log_level", ["DEBUG", "INFO", "WARNING"])
+    def test_update_batch_logs_match_update(self, log_level):
+        """バッチ更新と逐次更新のフレームごとのログ出力の一致テスト"""
+        config = Config(continuous_close_time=0.2, log_level=log_level)
+        frame_nums = np.array([1, 2, 3, 4, 5, 6, 7, 8, 3, 9, 10, 11, 12])
+        eye_values = np.array([0.05] * 8 + [0.8, 0.05, 0.05, 0.05, 0.05])
+        face = np.array([0.95] * 9 + [0.5] + [0.95] * 3)
+        
+        def capture_logs(process):
+            records = []
+            detector = DrowsyDetector(config)
+            handler = logging.Handler()
+            handler.emit = records.append
+            detector.logger.logger.addHandler(handler)
+            try:
+                process(detector)
+            finally:
+                detector.logger.logger.removeHandler(handler)
+            # 処理時間・バッチ集計のログは比較対象外
+            return [
+                (r.levelname, r.getMessage()) for r in records
+                if not r.getMessage().startswith(("Performance:", "Batch of"))
+            ]
+        
+        def sequential(detector):
+            for frame_num, value, conf in zip(frame_nums.tolist(), eye_values.tolist(), face.tolist()):
+                detector.update(InputData(
+                    frame_num=frame_num,
+                    left_eye_open=value,
+                    right_eye_open=value,
+                    face_confidence=conf
+                ))
+        
+        expected = capture_logs(sequential)
+        actual = capture_logs(lambda detector: detector.update_batch(frame_nums, eye_values, eye_values, face))
+        
+        assert actual == expected
+        assert ("WARNING", "Invalid frame number: 3 <= 8") in actual
+        if log_level != "WARNING":
+            assert ("INFO", "Drowsiness detected at frame 7") in actual
+    
+    def test_update_raw_matches_update(self, config):
+        """InputData を介さない更新と通常の更新の一致テスト"""
+        frames = [(1, 0.8, 0.8, 0.95), (2, 0.1, 0.1, 0.95), (2, 0.1, 0.1, 0.95), (3, 0.1, 0.1, 0.5)]
+        detector = DrowsyDetector(config)
+        raw_detector = DrowsyDetector(config)
+        
+        for frame_num, left, right, face in frames:
+            expected = detector.update(InputData(
+                frame_num=frame_num,
+                left_eye_open=left,
+                right_eye_open=right,
+                face_confidence=face
+            ))
+            assert raw_detector.update_raw(frame_num, left, right, face).to_dict() == expected.to_dict()
+    
+    def test_eye_filter_state_matches_manager(self, config):
+        """目の状態更新とフィルタ状態の EyeStateManager との一致テスト"""
+        detector = DrowsyDetector(config)
+        left_manager = EyeStateManager(config.left_eye_close_threshold, alpha=config.ema_alpha)
+        right_manager = EyeStateManager(config.right_eye_close_threshold, alpha=config.ema_alpha)
+        
+        for i, (left, right) in enumerate([(0.9, 0.1), (0.05, 0.2), (0.1, 0.1), (0.6, 0.05)]):
+            result = detector.update_raw(i + 1, left, right, 0.95)
+            assert result.left_eye_closed == left_manager.update(left).is_closed
+            assert result.right_eye_closed == right_manager.update(right).is_closed
+        
+        assert detector.left_eye_manager.get_filter_state() == left_manager.get_filter_state()
+        assert detector.right_eye_manager.get_filter_state() == right_manager.get_filter_state()
+    
+    def test_debug_flag_follows_shared_logger(self):
+        """共有ロガーのレベル変更に DEBUG 判定が追従するテスト"""
+        detector = DrowsyDetector(Config(log_level="INFO"))
+        assert not detector.logger.debug_enabled
+        
+        # 別の検出器の生成で共有ロガーのレベルが DEBUG に変わる
+        DrowsyDetector(Config(log_level="DEBUG"))
+        assert detector.logger.debug_enabled
+        
+        detector.logger.set_level("INFO")
+        assert not detector.logger.debug_enabled
+    
+    def test_update_batch_error_codes(self, detector):
+        """バッチ更新のエラーコードのテスト"""
+        result = detector.update_batch(
+            np.array([5, 3, 6]),
+            np.array([0.8, 0.8, 0.8]),
+            np.array([0.8, 0.8, 0.8]),
+            np.array([0.95, 0.95, 0.5])
+        )
+        
+        assert len(result) == 3
+        assert result.is_drowsy.tolist() == [0, -1, -1]
+        assert result.error_code.tolist() == [None, "INVALID_FRAME_NUM", "LOW_FACE_CONFIDENCE"]
+        assert detector.last_frame_num == 5
+    
+    def test_update_batch_nan_carry_forward(self, detector):
+        """バッチ更新での NaN 補完のテスト"""
+        detector.update_batch(
+            np.array([1, 2, 3]),
+            np.array([0.8, np.nan, np.nan]),
+            np.array([0.8, 0.8, 0.8]),
+            np.array([0.95, 0.95, 0.95])
+        )
+        
+        stats = detector.get_statistics()
+        assert stats['data_processor']['total_processed'] == 3
+        assert stats['data_processor']['nan_count'] == 2
+        assert detector.data_processor.last_valid_data.left_eye_open == 0.8
@@ -6,82 +6,74 @@
 
 import pytest
 import numpy as np
-import sys
 import time
-from pathlib import Path
 
-# パッケージのルートを追加
-sys.path.append(str(Path(__file__).parent.parent))
+from drowsy_detection.config.config import Config
+from drowsy_detection.config.validators import InputData
+from drowsy_detection.core.drowsy_detector import DrowsyDetector
 
-from source.config.config import Config
-from source.config.validators import InputData
-from source.core.drowsy_detector import DrowsyDetector
+
+# テストで使用する設定（検出器は設定を変更しないため、検証済みのものをモジュール内で共有）
+_CFG_QUIET = Config(log_level="ERROR")
+_CFG_REALISTIC = Config(
+    left_eye_close_threshold=0.30,
+    right_eye_close_threshold=0.30,
+    continuous_close_time=1.5,
+    face_conf_threshold=0.70,
+    log_level="ERROR"
+)
+_CFG_LONG = Config(
+    continuous_close_time=0.5,  # 短時間でテスト
+    log_level="ERROR"
+)
+_CFG_FILTER_ON = Config(
+    enable_ema_filter=True,
+    ema_alpha=0.3,
+    log_level="ERROR"
+)
+_CFG_FILTER_OFF = Config(
+    enable_ema_filter=False,
+    log_level="ERROR"
+)
 
 
 class TestIntegration:
     """統合テスト"""
     
+    @pytest.mark.slow
     def test_realistic_scenario(self):
         """現実的なシナリオのテスト"""
-        config = Config(
-            left_eye_close_threshold=0.30,
-            right_eye_close_threshold=0.30,
-            continuous_close_time=1.5,
-            face_conf_threshold=0.70,
-            log_level="ERROR"
-        )
-        detector = DrowsyDetector(config)
+        detector = DrowsyDetector(_CFG_REALISTIC)
         
-        # 現実的なデータシーケンス
-        scenarios = [
-            # 1. 正常な運転開始 (30フレーム = 1秒)
-            [(0.8, 0.85, 0.95) for _ in range(30)],
-            
-            # 2. 軽いまばたき (6フレーム = 0.2秒)
-            [(0.1, 0.1, 0.95) for _ in range(6)],
-            
-            # 3. 正常状態に戻る (30フレーム = 1秒)
-            [(0.8, 0.85, 0.95) for _ in range(30)],
-            
-            # 4. 疲労による長時間閉眼 (60フレーム = 2秒)
-            [(0.15, 0.18, 0.90) for _ in range(60)],
-            
-            # 5. 覚醒 (30フレーム = 1秒)
-            [(0.9, 0.9, 0.95) for _ in range(30)],
-            
-            # 6. 顔検出失敗 (15フレーム = 0.5秒)
-            [(0.8, 0.8, 0.5) for _ in range(15)],
-            
-            # 7. 正常復帰 (30フレーム = 1秒)
-            [(0.8, 0.85, 0.95) for _ in range(30)],
-        ]
+        # 現実的なデータシーケンス（[左目, 右目, 顔検出信頼度] とフレーム数）
+        scenarios = np.array([
+            [0.8, 0.85, 0.95],  # 1. 正常な運転開始 (30フレーム = 1秒)
+            [0.1, 0.1, 0.95],   # 2. 軽いまばたき (6フレーム = 0.2秒)
+            [0.8, 0.85, 0.95],  # 3. 正常状態に戻る (30フレーム = 1秒)
+            [0.15, 0.18, 0.90], # 4. 疲労による長時間閉眼 (60フレーム = 2秒)
+            [0.9, 0.9, 0.95],   # 5. 覚醒 (30フレーム = 1秒)
+            [0.8, 0.8, 0.5],    # 6. 顔検出失敗 (15フレーム = 0.5秒)
+            [0.8, 0.85, 0.95],  # 7. 正常復帰 (30フレーム = 1秒)
+        ])
+        frames = np.repeat(scenarios, [30, 6, 30, 60, 30, 15, 30], axis=0)
         
-        frame_num = 1
-        drowsy_periods = []
-        error_count = 0
-        current_drowsy_start = None
+        is_drowsy = np.empty(len(frames), dtype=np.int8)
+        for i, (left_eye, right_eye, face_conf) in enumerate(frames.tolist()):
+            input_data = InputData(
+                frame_num=i + 1,
+                left_eye_open=left_eye,
+                right_eye_open=right_eye,
+                face_confidence=face_conf
+            )
+            is_drowsy[i] = detector.update(input_data).is_drowsy
         
-        for scenario in scenarios:
-            for left_eye, right_eye, face_conf in scenario:
-                input_data = InputData(
-                    frame_num=frame_num,
-                    left_eye_open=left_eye,
-                    right_eye_open=right_eye,
-                    face_confidence=face_conf
-                )
-                
-                result = detector.update(input_data)
-                
-                # 眠気検知の追跡
-                if result.is_drowsy == 1 and current_drowsy_start is None:
-                    current_drowsy_start = frame_num
-                elif result.is_drowsy != 1 and current_drowsy_start is not None:
-                    drowsy_periods.append((current_drowsy_start, frame_num - 1))
-                    current_drowsy_start = None
-                elif result.is_drowsy == -1:
-                    error_count += 1
-                
-                frame_num += 1
+        # 眠気検知区間（開始・終了フレーム番号）とエラー件数を集計
+        transitions = np.diff((is_drowsy == 1).astype(np.int8), prepend=0, append=0)
+        drowsy_periods = list(zip(
+            (np.flatnonzero(transitions == 1) + 1).tolist(),
+            np.flatnonzero(transitions == -1).tolist()
+        ))
+        error_count = int(np.count_nonzero(is_drowsy == -1))
         
         # 結果検証
         assert len(drowsy_periods) >= 1, "少なくとも1回の眠気検知があるべき"
@@ -92,64 +84,67 @@ class TestIntegration:
         assert stats['data_processor']['total_processed'] > 0
         assert stats['data_processor']['nan_count'] == 0  # NaNは発生しないはず
     
-    def test_long_duration_simulation(self):
-        """長時間シミュレーションテスト"""
-        config = Config(
-            continuous_close_time=0.5,  # 短時間でテスト
-            log_level="ERROR"
-        )
-        detector = DrowsyDetector(config)
+    @pytest.mark.slow
+    @pytest.mark.parametrize("use_batch", [False, True], ids=["update", "update_batch"])
+    def test_long_duration_simulation(self, use_batch):
+        """長時間シミュレーションテスト（逐次更新・バッチ更新）"""
+        detector = DrowsyDetector(_CFG_LONG)
         
-        drowsy_count = 0
         total_frames = 900  # 30fps * 30秒
         
-        np.random.seed(42)  # 再現可能な結果のため
+        rng = np.random.default_rng(42)  # 再現可能な結果のため
         
-        for i in range(total_frames):
-            # ランダムな開眼度（時々閉眼）
-            if i % 100 < 20:  # 20%の確率で閉眼期間
-                left_eye = np.random.uniform(0.0, 0.2)
-                right_eye = np.random.uniform(0.0, 0.2)
-            else:
-                left_eye = np.random.uniform(0.5, 1.0)
-                right_eye = np.random.uniform(0.5, 1.0)
-            
-            # 顔検出信頼度もランダム（ほとんどは高い）
-            if np.random.random() < 0.05:  # 5%の確率で低信頼度
-                face_confidence = np.random.uniform(0.3, 0.6)
-            else:
-                face_confidence = np.random.uniform(0.8, 1.0)
-            
-            input_data = InputData(
-                frame_num=i+1,
-                left_eye_open=left_eye,
-                right_eye_open=right_eye,
-                face_confidence=face_confidence
+        # ランダムな開眼度（100フレーム中20フレームは閉眼期間）
+        closed = np.arange(total_frames) % 100 < 20
+        left_eyes = np.where(closed, rng.uniform(0.0, 0.2, total_frames), rng.uniform(0.5, 1.0, total_frames))
+        right_eyes = np.where(closed, rng.uniform(0.0, 0.2, total_frames), rng.uniform(0.5, 1.0, total_frames))
+        
+        # 顔検出信頼度もランダム（5%の確率で低信頼度、ほとんどは高い）
+        low_face = rng.random(total_frames) < 0.05
+        face_confidences = np.where(low_face, rng.uniform(0.3, 0.6, total_frames), rng.uniform(0.8, 1.0, total_frames))
+        
+        if use_batch:
+            results = detector.update_batch(
+                np.arange(1, total_frames + 1), left_eyes, right_eyes, face_confidences
             )
-            
-            result = detector.update(input_data)
-            if result.is_drowsy == 1:
-                drowsy_count += 1
+            drowsy_count = int(np.count_nonzero(results.is_drowsy == 1))
+        else:
+            drowsy_count = 0
+            for i, (left_eye, right_eye, face_confidence) in enumerate(
+                zip(left_eyes.tolist(), right_eyes.tolist(), face_confidences.tolist())
+            ):
+                input_data = InputData(
+                    frame_num=i+1,
+                    left_eye_open=left_eye,
+                    right_eye_open=right_eye,
+                    face_confidence=face_confidence
+                )
+                
+                result = detector.update(input_data)
+                if result.is_drowsy == 1:
+                    drowsy_count += 1
         
         # 誤検知率チェック（10%以下であることを確認）
         false_positive_rate = drowsy_count / total_frames
         assert false_positive_rate < 0.10, f"誤検知率が高すぎます: {false_positive_rate*100:.1f}%"
         
-        # 統計情報の確認
+        # 統計情報の確認（顔検出信頼度が閾値未満のフレームは前処理されない）
         stats = detector.get_statistics()
-        assert stats['data_processor']['total_processed'] == total_frames
+        low_face_frames = int(np.count_nonzero(face_confidences < _CFG_LONG.face_conf_threshold))
+        assert low_face_frames > 0
+        assert stats['data_processor']['total_processed'] == total_frames - low_face_frames
         print(f"NaN発生率: {stats['data_processor']['nan_rate']*100:.2f}%")
         print(f"眠気検知率: {false_positive_rate*100:.2f}%")
     
+    @pytest.mark.slow
     def test_performance_benchmark(self):
         """パフォーマンスベンチマーク"""
-        config = Config(log_level="ERROR")
-        detector = DrowsyDetector(config)
+        detector = DrowsyDetector(_CFG_QUIET)
         
         num_frames = 1000
         
-        # パフォーマンス測定
-        start_time = time.time()
+        # パフォーマンス測定（単調増加・高分解能の時計を使用）
+        start_time = time.perf_counter()
         
         for i in range(num_frames):
             input_data = InputData(
@@ -160,8 +155,7 @@ class TestIntegration:
             )
             detector.update(input_data)
         
-        end_time = time.time()
-        duration = end_time - start_time
+        duration = time.perf_counter() - start_time
         fps = num_frames / duration
         
         print(f"処理性能: {fps:.1f} FPS ({duration:.3f}秒で{num_frames}フレーム)")
@@ -169,10 +163,28 @@ class TestIntegration:
         # 30fps以上の処理速度を期待
         assert fps >= 30.0, f"処理速度が不十分です: {fps:.1f} FPS"
     
+    def test_batch_performance_benchmark(self):
+        """バッチ処理のパフォーマンスベンチマーク"""
+        detector = DrowsyDetector(_CFG_QUIET)
+        
+        num_frames = 1000
+        frame_nums = np.arange(1, num_frames + 1)
+        eye_values = np.full(num_frames, 0.5)
+        face_confidences = np.full(num_frames, 0.95)
+        
+        start_time = time.perf_counter()
+        results = detector.update_batch(frame_nums, eye_values, eye_values, face_confidences)
+        duration = time.perf_counter() - start_time
+        fps = num_frames / duration
+        
+        print(f"バッチ処理性能: {fps:.1f} FPS ({duration:.3f}秒で{num_frames}フレーム)")
+        
+        assert len(results) == num_frames
+        assert fps >= 30.0, f"処理速度が不十分です: {fps:.1f} FPS"
+    
     def test_edge_cases(self):
         """エッジケースのテスト"""
-        config = Config(log_level="ERROR")
-        detector = DrowsyDetector(config)
+        detector = DrowsyDetector(_CFG_QUIET)
         
         edge_cases = [
             # 極端な値
@@ -190,6 +202,7 @@ class TestIntegration:
             (0.29, 0.29, 0.69), # 閾値をわずかに下回る
         ]
         
+        results = []
         for i, (left_eye, right_eye, face_conf) in enumerate(edge_cases):
             input_data = InputData(
                 frame_num=i+1,
@@ -203,32 +216,28 @@ class TestIntegration:
             assert result is not None
             assert result.frame_num == i+1
             assert result.is_drowsy in [-1, 0, 1]
+            results.append(result.to_dict())
+        
+        # 同じエッジケースを配列でまとめて処理しても同じ結果になることを確認
+        values = np.array(edge_cases)
+        batch_results = DrowsyDetector(_CFG_QUIET).update_batch(
+            np.arange(1, len(edge_cases) + 1), values[:, 0], values[:, 1], values[:, 2]
+        )
+        assert batch_results.to_dicts() == results
     
     def test_filter_effectiveness(self):
         """フィルタ効果のテスト"""
-        # フィルタありの設定
-        config_with_filter = Config(
-            enable_ema_filter=True,
-            ema_alpha=0.3,
-            log_level="ERROR"
-        )
-        detector_with_filter = DrowsyDetector(config_with_filter)
-        
-        # フィルタなしの設定
-        config_without_filter = Config(
-            enable_ema_filter=False,
-            log_level="ERROR"
-        )
-        detector_without_filter = DrowsyDetector(config_without_filter)
+        detector_with_filter = DrowsyDetector(_CFG_FILTER_ON)
+        detector_without_filter = DrowsyDetector(_CFG_FILTER_OFF)
         
         # ノイズの多いデータ
-        np.random.seed(42)
+        rng = np.random.default_rng(42)
         noisy_data = []
         base_value = 0.7
         
         for i in range(50):
             # ベース値にランダムノイズを追加
-            noise = np.random.uniform(-0.3, 0.3)
+            noise = rng.uniform(-0.3, 0.3)
             noisy_value = max(0.0, min(1.0, base_value + noise))
             noisy_data.append(noisy_value)
         
@@ -267,3 +276,33 @@ class TestIntegration:
         
         # フィルタありの方が状態変化が少ない（より安定）ことを期待
         assert changes_with_filter <= changes_without_filter + 2  # 多少の許容差
+    
+    def test_filter_effectiveness_batch(self):
+        """フィルタ効果のテスト（バッチ更新）"""
+        detector_with_filter = DrowsyDetector(_CFG_FILTER_ON)
+        detector_without_filter = DrowsyDetector(_CFG_FILTER_OFF)
+        
+        # ノイズの多いデータ（ベース値にランダムノイズを追加）
+        rng = np.random.default_rng(42)
+        num_frames = 50
+        noisy_data = np.clip(0.7 + rng.uniform(-0.3, 0.3, num_frames), 0.0, 1.0)
+        frame_nums = np.arange(1, num_frames + 1)
+        face_confidences = np.full(num_frames, 0.95)
+        
+        results_with_filter = detector_with_filter.update_batch(
+            frame_nums, noisy_data, noisy_data, face_confidences
+        )
+        results_without_filter = detector_without_filter.update_batch(
+            frame_nums, noisy_data, noisy_data, face_confidences
+        )
+        
+        # フィルタありの方がより安定した結果を示すことを確認
+        # （ここでは簡単な確認として、連続した結果の変動を比較）
+        changes_with_filter = int(np.count_nonzero(np.diff(results_with_filter.is_drowsy)))
+        changes_without_filter = int(np.count_nonzero(np.diff(results_without_filter.is_drowsy)))
+        
+        print(f"フィルタあり状態変化: {changes_with_filter}")
+        print(f"フィルタなし状態変化: {changes_without_filter}")
+        
+        # フィルタありの方が状態変化が少ない（より安定）ことを期待
+        assert changes_with_filter <= changes_without_filter + 2  # 多少の許容差